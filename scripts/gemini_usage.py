@@ -13,6 +13,9 @@ Usage:
 Requirements:
     pip install google-cloud-billing google-cloud-monitoring google-auth
     
+    Optional (faster BigQuery downloads):
+    pip install pyarrow google-cloud-bigquery-storage
+    
     Or with uv:
     uv run --with google-cloud-billing --with google-cloud-monitoring python gemini_usage.py
 
@@ -23,25 +26,40 @@ Authentication:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import hashlib
+import importlib.util
+import json
+import re
+import threading
+import time
+from collections import defaultdict
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from functools import lru_cache
+from operator import attrgetter
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-# Google Cloud clients
-try:
-    from google.cloud import billing_v1, monitoring_v3
-    from google.cloud.billing import budgets_v1
-    HAS_CLOUD_LIBS = True
-except ImportError:
-    HAS_CLOUD_LIBS = False
+if TYPE_CHECKING:
+    import httpx
 
-try:
-    import google.auth
-    import requests
-    from google.auth.transport.requests import Request
-    from google.oauth2.credentials import Credentials
-    HAS_AUTH = True
-except ImportError:
-    HAS_AUTH = False
+
+
+def _has_module(name: str) -> bool:
+    """Check whether a module is installed without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+# Google Cloud clients are imported inside the functions that use them: they
+# pull in gRPC and protobuf descriptors that --instructions/--help never need.
+HAS_CLOUD_LIBS = _has_module("google.cloud.billing_v1") and _has_module(
+    "google.cloud.monitoring_v3"
+)
+HAS_AUTH = _has_module("google.auth") and _has_module("httpx")
 
 
 # =============================================================================
@@ -51,8 +69,16 @@ except ImportError:
 PROJECT_ID = "gen-lang-client-0202182328"
 BILLING_ACCOUNT = "01D2F4-3F2B44-2B0851"
 
+# Billing Catalog SKUs change on the order of days, so lookups are cached on disk
+PRICING_CACHE_FILE = Path.home() / ".cache" / "gemini-research-mcp" / "pricing.json"
+PRICING_CACHE_TTL = timedelta(hours=24)
+
+# Billing Catalog services / SKUs that belong to Gemini
+_GEMINI_SERVICE_RE = re.compile(r"generative|gemini", re.IGNORECASE)
+_GEMINI_SKU_RE = re.compile(r"gemini|token", re.IGNORECASE)
+
 # Gemini API pricing (Feb 2026)
-PRICING = {
+PRICING = MappingProxyType({
     "gemini-2.0-flash": {
         "input_per_1m": 0.10,
         "output_per_1m": 0.40,
@@ -65,13 +91,61 @@ PRICING = {
         "input_per_1m": 2.00,
         "output_per_1m": 12.00,
     },
-}
+})
+
+# PRICING is static, so the report's pricing section is rendered once
+_PRICING_REPORT = "\n".join(
+    f"  {model}:\n"
+    f"    Input:  ${prices['input_per_1m']}/1M tokens\n"
+    f"    Output: ${prices['output_per_1m']}/1M tokens"
+    for model, prices in PRICING.items()
+)
+
+
+# =============================================================================
+# Credentials
+# =============================================================================
+
+_credentials_lock = threading.Lock()
+
+
+def _get_credentials() -> Any:
+    """
+    Resolve Application Default Credentials once for every Cloud client.
+    
+    Each client would otherwise run its own ADC discovery and token fetch.
+    The lock makes concurrent first callers (the report fetches from worker
+    threads) wait for a single discovery and token refresh.
+    """
+    with _credentials_lock:
+        return _load_credentials()
+
+
+@lru_cache(maxsize=1)
+def _load_credentials() -> Any:
+    """Run ADC discovery and refresh the token up front (call via _get_credentials)."""
+    import google.auth
+    from google.auth.transport.requests import Request
+    
+    credentials, _ = google.auth.default(
+        scopes=["https://www.googleapis.com/auth/cloud-platform"]
+    )
+    credentials.refresh(Request())
+    return credentials
 
 
 # =============================================================================
 # Method 1: BigQuery Export (Most Accurate)
 # =============================================================================
 
+@lru_cache(maxsize=1)
+def _get_bigquery_client(project_id: str) -> Any:
+    """Return a BigQuery client, reused across calls for the same project."""
+    from google.cloud import bigquery
+
+    return bigquery.Client(project=project_id, credentials=_get_credentials())
+
+
 def get_usage_from_bigquery(
     project_id: str = PROJECT_ID,
     start_date: str | None = None,
@@ -92,7 +166,7 @@ def get_usage_from_bigquery(
         print("   pip install google-cloud-bigquery")
         return []
     
-    client = bigquery.Client(project=project_id)
+    client = _get_bigquery_client(project_id)
     
     # Adjust dates
     if not start_date:
@@ -103,6 +177,8 @@ def get_usage_from_bigquery(
     # Query the billing export table
     # Note: You need to set up billing export first
     # The dataset/table name depends on your setup
+    # Dates are bound as query parameters so the query text stays constant
+    # and BigQuery can serve repeated runs from its results cache.
     query = f"""
     SELECT
         service.description as service,
@@ -115,17 +191,28 @@ def get_usage_from_bigquery(
         currency,
         project.id as project_id
     FROM `{project_id}.billing_export.gcp_billing_export_v1_{BILLING_ACCOUNT.replace('-', '_')}`
-    WHERE 
+    WHERE (
         service.description LIKE '%Generative%'
         OR service.description LIKE '%Vertex AI%'
         OR service.description LIKE '%Gemini%'
-    AND DATE(usage_start_time) >= '{start_date}'
-    AND DATE(usage_end_time) <= '{end_date}'
+    )
+    AND DATE(usage_start_time) >= @start_date
+    AND DATE(usage_end_time) <= @end_date
     ORDER BY usage_start_time DESC
     """
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("start_date", "DATE", start_date),
+            bigquery.ScalarQueryParameter("end_date", "DATE", end_date),
+        ]
+    )
     
     try:
-        results = client.query(query).result()
+        results = client.query(query, job_config=job_config).result()
+        if importlib.util.find_spec("pyarrow") is not None:
+            # Columnar download over the BigQuery Storage API instead of
+            # materializing a Row object per result
+            return results.to_arrow(create_bqstorage_client=True).to_pylist()
         return [dict(row) for row in results]
     except Exception as e:
         print(f"⚠️ BigQuery query failed: {e}")
@@ -137,6 +224,75 @@ def get_usage_from_bigquery(
 # Method 2: Cloud Monitoring API
 # =============================================================================
 
+_INT64_POINT_VALUE = attrgetter("value.int64_value")
+_DOUBLE_POINT_VALUE = attrgetter("value.double_value")
+
+
+def _sum_points(time_series: Any) -> float:
+    """
+    Sum the point values of a time series.
+    
+    A series has a single value_type, so the matching field is chosen once
+    rather than probing int64_value and double_value on every point.
+    """
+    from google.api import metric_pb2
+    
+    value_type = time_series.value_type
+    if value_type == metric_pb2.MetricDescriptor.ValueType.INT64:
+        return sum(map(_INT64_POINT_VALUE, time_series.points))
+    if value_type == metric_pb2.MetricDescriptor.ValueType.DOUBLE:
+        return sum(map(_DOUBLE_POINT_VALUE, time_series.points))
+    return sum(
+        point.value.int64_value or point.value.double_value or 0
+        for point in time_series.points
+    )
+
+
+async def _list_time_series_concurrently(
+    project_name: str,
+    interval: Any,
+    metric_types: list[str],
+    window_seconds: int,
+) -> list[tuple[str, list[Any] | BaseException]]:
+    """
+    Fetch the time series for every metric type concurrently.
+    
+    Each metric is an independent RPC, so they are fanned out with
+    asyncio.gather instead of paying one round-trip per metric in turn.
+    Points are summed server-side over the whole window, so each series
+    comes back with a single aggregated point rather than its raw samples.
+    Failures are returned in place of the series list.
+    """
+    from google.cloud import monitoring_v3
+    
+    aggregation = monitoring_v3.Aggregation({
+        "alignment_period": {"seconds": window_seconds},
+        "per_series_aligner": monitoring_v3.Aggregation.Aligner.ALIGN_SUM,
+    })
+    
+    # The context manager closes the gRPC channel before asyncio.run tears
+    # down the loop, so no unclosed-transport warnings are left behind.
+    async with monitoring_v3.MetricServiceAsyncClient(
+        credentials=_get_credentials()
+    ) as client:
+        async def fetch(metric_type: str) -> list[Any]:
+            request = monitoring_v3.ListTimeSeriesRequest(
+                name=project_name,
+                filter=f'metric.type = "{metric_type}"',
+                interval=interval,
+                aggregation=aggregation,
+                view=monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
+            )
+            page_result = await client.list_time_series(request=request)
+            return [time_series async for time_series in page_result]
+        
+        fetched = await asyncio.gather(
+            *(fetch(metric_type) for metric_type in metric_types),
+            return_exceptions=True,
+        )
+    return list(zip(metric_types, fetched, strict=True))
+
+
 def get_usage_from_monitoring(
     project_id: str = PROJECT_ID,
     days: int = 30,
@@ -151,7 +307,8 @@ def get_usage_from_monitoring(
         print("   pip install google-cloud-monitoring")
         return {}
     
-    client = monitoring_v3.MetricServiceClient()
+    from google.cloud import monitoring_v3
+    
     project_name = f"projects/{project_id}"
     
     now = datetime.now(UTC)
@@ -177,38 +334,32 @@ def get_usage_from_monitoring(
         "aiplatform.googleapis.com/prediction/online_prediction_tokens",
     ]
     
-    for metric_type in metric_types:
-        try:
-            request = monitoring_v3.ListTimeSeriesRequest(
-                name=project_name,
-                filter=f'metric.type = "{metric_type}"',
-                interval=interval,
-                view=monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-            )
+    fetched = asyncio.run(
+        _list_time_series_concurrently(
+            project_name, interval, metric_types, window_seconds=days * 86400
+        )
+    )
+    
+    for metric_type, series in fetched:
+        if isinstance(series, BaseException):
+            # Metric might not exist for this project
+            continue
+        
+        for time_series in series:
+            metric_name = time_series.metric.type.split("/")[-1]
+            labels = dict(time_series.metric.labels)
             
-            page_result = client.list_time_series(request=request)
+            total = _sum_points(time_series)
             
-            for time_series in page_result:
-                metric_name = time_series.metric.type.split("/")[-1]
-                labels = dict(time_series.metric.labels)
-                
-                total = 0
-                for point in time_series.points:
-                    total += point.value.int64_value or point.value.double_value or 0
-                
-                key = f"{metric_name}"
-                if labels.get("model"):
-                    key += f"_{labels['model']}"
-                
-                results[key] = {
-                    "total": total,
-                    "labels": labels,
-                    "metric_type": metric_type,
-                }
-                
-        except Exception:
-            # Metric might not exist for this project
-            pass
+            key = f"{metric_name}"
+            if labels.get("model"):
+                key += f"_{labels['model']}"
+            
+            results[key] = {
+                "total": total,
+                "labels": labels,
+                "metric_type": metric_type,
+            }
     
     return results
 
@@ -217,11 +368,73 @@ def get_usage_from_monitoring(
 # Method 3: API Key Usage via Google AI Studio
 # =============================================================================
 
-def get_api_key_usage(api_key: str | None = None) -> dict[str, Any]:
+# Rate-limit headers are stable within ~1 minute windows, so repeated probes
+# within API_KEY_USAGE_TTL seconds are answered from memory. Entries are keyed
+# by a hash of the API key, never the key itself.
+API_KEY_USAGE_TTL = 30.0
+_api_key_usage_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+# Client-side pacing keeps quota probes under the per-minute request budget,
+# so tight polling loops are delayed locally instead of triggering HTTP 429s.
+API_KEY_PROBES_PER_MINUTE = 60
+_next_probe_at = 0.0
+
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client for the running event loop.
+    
+    A client's connections belong to the loop that opened them, so a new
+    client is created when called from a different loop (e.g. a second
+    asyncio.run in the same process).
+    """
+    global _http_client, _http_client_loop
+    
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client_loop is not loop:
+        import httpx
+        
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=20),
+            timeout=10,
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client; call before the event loop shuts down."""
+    global _http_client, _http_client_loop
+    
+    if _http_client is not None:
+        await _http_client.aclose()
+    _http_client = None
+    _http_client_loop = None
+
+
+async def _pace_api_key_probe() -> None:
+    """Wait until the next probe slot so requests stay under the budget."""
+    global _next_probe_at
+    
+    # No await between reading and reserving the slot, so concurrent callers
+    # on the same event loop each get a distinct slot.
+    now = time.monotonic()
+    wait = _next_probe_at - now
+    _next_probe_at = max(now, _next_probe_at) + 60.0 / API_KEY_PROBES_PER_MINUTE
+    if wait > 0:
+        await asyncio.sleep(wait)
+
+
+async def get_api_key_usage(api_key: str | None = None) -> dict[str, Any]:
     """
     Get usage for a specific API key via Google AI Studio.
     
     Note: This endpoint may have limited historical data.
+    Repeated calls share one pooled HTTP client, so keep-alive connections
+    and TLS sessions are reused instead of re-handshaking per probe. Await
+    close_http_client() once the probes are done.
     """
     import os
     
@@ -233,22 +446,35 @@ def get_api_key_usage(api_key: str | None = None) -> dict[str, Any]:
         print("   Set GOOGLE_API_KEY or GEMINI_API_KEY environment variable")
         return {}
     
+    cache_key = hashlib.sha256(api_key.encode()).hexdigest()
+    cached = _api_key_usage_cache.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < API_KEY_USAGE_TTL:
+        return dict(cached[1])
+    
     # There's no official "usage" endpoint, but we can check quota
     # via a models.list call and inspect headers
-    url = f"https://generativelanguage.googleapis.com/v1beta/models?key={api_key}"
+    url = "https://generativelanguage.googleapis.com/v1beta/models"
     
     try:
-        response = requests.get(url)
+        await _pace_api_key_probe()
+        # Only the headers are inspected, so ask for them alone. A fully read
+        # response keeps its connection in the pool; a half-read stream would not.
+        client = _get_http_client()
+        response = await client.head(url, params={"key": api_key})
+        if response.status_code == 405:
+            response = await client.get(url, params={"key": api_key})
+        headers = response.headers
         
         # Check rate limit headers for usage hints
-        headers = dict(response.headers)
         usage_info = {
             "rate_limit_remaining": headers.get("x-ratelimit-remaining-requests"),
             "rate_limit_limit": headers.get("x-ratelimit-limit-requests"),
             "quota_user": headers.get("x-goog-quota-user"),
         }
         
-        return {k: v for k, v in usage_info.items() if v is not None}
+        usage = {k: v for k, v in usage_info.items() if v is not None}
+        _api_key_usage_cache[cache_key] = (time.monotonic(), usage)
+        return dict(usage)
         
     except Exception as e:
         print(f"⚠️ Failed to query API: {e}")
@@ -259,43 +485,95 @@ def get_api_key_usage(api_key: str | None = None) -> dict[str, Any]:
 # Method 4: Cloud Billing Catalog (for pricing reference)
 # =============================================================================
 
+def _load_cached_pricing() -> list[dict] | None:
+    """Return cached pricing SKUs, or None if the cache is missing or stale."""
+    try:
+        age = time.time() - PRICING_CACHE_FILE.stat().st_mtime
+        if age > PRICING_CACHE_TTL.total_seconds():
+            return None
+        cached = json.loads(PRICING_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return None
+    return cached if isinstance(cached, list) else None
+
+
+def _store_cached_pricing(skus: list[dict]) -> None:
+    """Persist pricing SKUs for later runs (best effort)."""
+    try:
+        PRICING_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        PRICING_CACHE_FILE.write_text(json.dumps(skus))
+    except OSError:
+        pass
+
+
+async def _list_gemini_skus() -> list[dict]:
+    """
+    Walk the Billing Catalog for Gemini SKUs.
+    
+    The per-service list_skus calls are independent, so they are issued
+    together with asyncio.gather and multiplexed over the async client's
+    single gRPC (HTTP/2) channel.
+    """
+    from google.cloud import billing_v1
+    
+    # Closing the client releases its gRPC channel before asyncio.run ends
+    async with billing_v1.CloudCatalogAsyncClient(credentials=_get_credentials()) as client:
+        # List services to find Generative AI
+        services = []
+        async for service in await client.list_services():
+            if _GEMINI_SERVICE_RE.search(service.display_name):
+                services.append(service)
+        
+        async def list_skus(service: Any) -> list[Any]:
+            pager = await client.list_skus(parent=service.name)
+            return [sku async for sku in pager]
+        
+        sku_lists = await asyncio.gather(*(list_skus(service) for service in services))
+    
+    gemini_skus = []
+    for service, skus in zip(services, sku_lists, strict=True):
+        for sku in skus:
+            if not _GEMINI_SKU_RE.search(sku.description):
+                continue
+            
+            pricing = None
+            if sku.pricing_info:
+                tiered_rates = sku.pricing_info[0].pricing_expression.tiered_rates
+                unit_price = tiered_rates[0].unit_price if tiered_rates else None
+                pricing = {
+                    "currency": unit_price.currency_code if unit_price is not None else None,
+                    "nanos": unit_price.nanos if unit_price is not None else None,
+                }
+            
+            gemini_skus.append({
+                "sku_id": sku.sku_id,
+                "description": sku.description,
+                "service": service.display_name,
+                "pricing": pricing,
+            })
+    
+    return gemini_skus
+
+
 def get_gemini_pricing() -> list[dict]:
     """
     Get current Gemini API pricing from Cloud Billing Catalog.
     
-    This fetches the actual pricing SKUs.
+    This fetches the actual pricing SKUs. Results are cached in
+    PRICING_CACHE_FILE for PRICING_CACHE_TTL, since walking the catalog
+    takes hundreds of RPCs.
     """
+    cached = _load_cached_pricing()
+    if cached is not None:
+        return cached
+    
     if not HAS_CLOUD_LIBS:
         print("❌ google-cloud-billing not installed")
         return []
     
     try:
-        client = billing_v1.CloudCatalogClient()
-        
-        # List services to find Generative AI
-        services = client.list_services()
-        
-        gemini_skus = []
-        for service in services:
-            if "generative" in service.display_name.lower() or "gemini" in service.display_name.lower():
-                # Get SKUs for this service
-                skus = client.list_skus(parent=service.name)
-                for sku in skus:
-                    if "gemini" in sku.description.lower() or "token" in sku.description.lower():
-                        pricing = None
-                        if sku.pricing_info:
-                            pricing = {
-                                "currency": sku.pricing_info[0].pricing_expression.tiered_rates[0].unit_price.currency_code if sku.pricing_info[0].pricing_expression.tiered_rates else None,
-                                "nanos": sku.pricing_info[0].pricing_expression.tiered_rates[0].unit_price.nanos if sku.pricing_info[0].pricing_expression.tiered_rates else None,
-                            }
-                        
-                        gemini_skus.append({
-                            "sku_id": sku.sku_id,
-                            "description": sku.description,
-                            "service": service.display_name,
-                            "pricing": pricing,
-                        })
-        
+        gemini_skus = asyncio.run(_list_gemini_skus())
+        _store_cached_pricing(gemini_skus)
         return gemini_skus
         
     except Exception as e:
@@ -304,44 +582,57 @@ def get_gemini_pricing() -> list[dict]:
 
 
 # =============================================================================
-# Method 5: gcloud CLI wrapper
+# Method 5: Metric descriptors (same data as `gcloud monitoring metrics list`)
 # =============================================================================
 
+@lru_cache(maxsize=1)
+def _get_monitoring_client() -> Any:
+    """Return a Cloud Monitoring client, reused across calls."""
+    from google.cloud import monitoring_v3
+    
+    return monitoring_v3.MetricServiceClient(credentials=_get_credentials())
+
+
 def get_usage_via_gcloud(days: int = 30) -> str:
     """
-    Get usage via gcloud CLI commands.
+    List the Gemini metric descriptors available in the project.
     
-    This is a fallback that doesn't require Python libraries.
+    Returns the same JSON as `gcloud monitoring metrics list --format json`,
+    but queries the Monitoring API in-process instead of spawning the
+    gcloud CLI.
     """
-    import subprocess
-    
-    start_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%dT00:00:00Z")
-    end_date = datetime.now().strftime("%Y-%m-%dT23:59:59Z")
+    if not HAS_CLOUD_LIBS:
+        return "google-cloud-monitoring not installed"
     
-    # Query Cloud Monitoring for Gemini metrics
-    cmd = [
-        "gcloud", "monitoring", "metrics", "list",
-        "--project", PROJECT_ID,
-        "--filter", "metric.type:generativelanguage",
-        "--format", "json",
-    ]
+    from google.protobuf.json_format import MessageToDict
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            return result.stdout
-        else:
-            return f"Error: {result.stderr}"
-    except subprocess.TimeoutExpired:
-        return "Command timed out"
-    except FileNotFoundError:
-        return "gcloud CLI not found"
+        descriptors = _get_monitoring_client().list_metric_descriptors(
+            request={
+                "name": f"projects/{PROJECT_ID}",
+                "filter": 'metric.type = starts_with("generativelanguage")',
+            },
+            timeout=30,
+        )
+        return json.dumps([MessageToDict(d) for d in descriptors], indent=2)
+    except Exception as e:
+        return f"Error: {e}"
 
 
 # =============================================================================
 # Main report
 # =============================================================================
 
+async def _fetch_report_data(days: int) -> tuple[dict[str, Any], list[dict]]:
+    """Fetch monitoring and billing data concurrently; both are blocking RPCs."""
+    start_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+    monitoring_data, bq_data = await asyncio.gather(
+        asyncio.to_thread(get_usage_from_monitoring, days=days),
+        asyncio.to_thread(get_usage_from_bigquery, start_date=start_date),
+    )
+    return monitoring_data, bq_data
+
+
 def generate_usage_report(days: int = 30) -> None:
     """Generate a comprehensive usage report."""
     
@@ -352,9 +643,10 @@ def generate_usage_report(days: int = 30) -> None:
     print("=" * 60)
     print()
     
-    # Try Cloud Monitoring
+    # Try Cloud Monitoring and BigQuery (if billing export is set up)
     print("🔍 Querying Cloud Monitoring API...")
-    monitoring_data = get_usage_from_monitoring(days=days)
+    print("🔍 Checking BigQuery billing export...")
+    monitoring_data, bq_data = asyncio.run(_fetch_report_data(days))
     
     if monitoring_data:
         print("\n📈 Cloud Monitoring Metrics:")
@@ -369,12 +661,6 @@ def generate_usage_report(days: int = 30) -> None:
     
     print()
     
-    # Try BigQuery (if billing export is set up)
-    print("🔍 Checking BigQuery billing export...")
-    bq_data = get_usage_from_bigquery(
-        start_date=(datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
-    )
-    
     if bq_data:
         print("\n💰 Billing Data (from BigQuery):")
         print("-" * 40)
@@ -382,10 +668,9 @@ def generate_usage_report(days: int = 30) -> None:
         print(f"  Total cost: ${total_cost:.2f}")
         
         # Group by SKU
-        by_sku: dict[str, float] = {}
+        by_sku: defaultdict[str, float] = defaultdict(float)
         for row in bq_data:
-            sku = row.get('sku', 'unknown')
-            by_sku[sku] = by_sku.get(sku, 0) + row.get('cost', 0)
+            by_sku[row.get('sku', 'unknown')] += row.get('cost', 0)
         
         for sku, cost in sorted(by_sku.items(), key=lambda x: -x[1]):
             print(f"  {sku}: ${cost:.2f}")
@@ -398,10 +683,7 @@ def generate_usage_report(days: int = 30) -> None:
     # Show pricing reference
     print("📋 Gemini API Pricing Reference:")
     print("-" * 40)
-    for model, prices in PRICING.items():
-        print(f"  {model}:")
-        print(f"    Input:  ${prices['input_per_1m']}/1M tokens")
-        print(f"    Output: ${prices['output_per_1m']}/1M tokens")
+    print(_PRICING_REPORT)
     
     print()
     print("=" * 60)
@@ -4,9 +4,14 @@ Query BigQuery Billing Export for Gemini API usage breakdown.
 Shows input vs output tokens and actual costs.
 """
 
+from __future__ import annotations
+
+import importlib.util
 import sys
+from typing import TYPE_CHECKING
 
-from google.cloud import bigquery
+if TYPE_CHECKING:
+    from google.cloud import bigquery
 
 PROJECT_ID = "gen-lang-client-0202182328"
 DATASET_ID = "billing_export"
@@ -16,86 +21,67 @@ DATASET_ID = "billing_export"
 TABLE_PATTERN = f"{PROJECT_ID}.{DATASET_ID}.gcp_billing_export_v1_*"
 
 
-def query_gemini_costs(days: int = 30) -> None:
-    """Query Gemini API costs from BigQuery billing export."""
-    client = bigquery.Client(project=PROJECT_ID)
-    
-    # First, find the actual table name
-    print(f"🔍 Looking for billing export tables in {DATASET_ID}...")
-    
-    tables_query = f"""
-    SELECT table_name 
-    FROM `{PROJECT_ID}.{DATASET_ID}.INFORMATION_SCHEMA.TABLES`
-    WHERE table_name LIKE 'gcp_billing_export%'
-    ORDER BY table_name DESC
-    LIMIT 5
+def _fetch_rows(client: bigquery.Client, query: str) -> list[dict]:
+    """Run a query and return its rows as dicts, via Arrow when available."""
+    result = client.query(query).result()
+    if importlib.util.find_spec("pyarrow") is not None:
+        # Columnar download over the BigQuery Storage API
+        return result.to_arrow(create_bqstorage_client=True).to_pylist()
+    return [dict(row) for row in result]
+
+
+def _build_cost_query(days: int) -> str:
+    """Build the per-SKU Gemini cost query over the last ``days`` days.
+
+    The wildcard table resolves the export table name server-side, so no
+    separate INFORMATION_SCHEMA lookup round-trip is needed. Aggregation and
+    input/output categorization run in BigQuery, so only one row per SKU
+    comes back instead of every raw usage record. The output aliases must not
+    reuse export column names (``sku``, ``cost``): GoogleSQL rejects
+    GROUP BY / ORDER BY references that could mean either.
     """
-    
-    try:
-        tables = list(client.query(tables_query).result())
-        if not tables:
-            print("\n⚠️  No billing export tables found yet.")
-            print("   This usually means:")
-            print("   1. Billing export not enabled yet")
-            print("   2. Data hasn't been exported yet (takes 24-48 hours)")
-            print("\n   Enable at: https://console.cloud.google.com/billing/01D2F4-3F2B44-2B0851/export")
-            print(f"   Select project: {PROJECT_ID}")
-            print(f"   Select dataset: {DATASET_ID}")
-            return
-            
-        print(f"   Found tables: {[t.table_name for t in tables]}")
-        table_name = tables[0].table_name
-        
-    except Exception as e:
-        if "Not found" in str(e):
-            print(f"\n⚠️  Dataset {DATASET_ID} not found or no access.")
-            print("   Make sure billing export is configured.")
-        else:
-            print(f"\n❌ Error checking tables: {e}")
-        return
-
-    # Query for Gemini API costs with input/output breakdown
-    print(f"\n📊 Querying Gemini costs for last {days} days...")
-    
-    query = f"""
+    return f"""
     SELECT
-        service.description as service,
-        sku.description as sku,
-        usage_start_time,
-        usage_end_time,
-        usage.amount as usage_amount,
-        usage.unit as usage_unit,
-        cost,
-        currency,
-        -- Extract model info from labels if available
-        (SELECT value FROM UNNEST(labels) WHERE key = 'model') as model
-    FROM `{PROJECT_ID}.{DATASET_ID}.{table_name}`
-    WHERE 
+        IFNULL(sku.description, 'Unknown') as sku_description,
+        SUM(cost) as total_cost,
+        SUM(usage.amount) as usage_amount,
+        ANY_VALUE(usage.unit) as usage_unit,
+        CASE
+            WHEN REGEXP_CONTAINS(LOWER(sku.description), r'input|prompt') THEN 'input'
+            WHEN REGEXP_CONTAINS(LOWER(sku.description), r'output|response|completion')
+                THEN 'output'
+            ELSE 'other'
+        END as category
+    FROM `{TABLE_PATTERN}`
+    WHERE (
         service.description LIKE '%Generative%' 
         OR service.description LIKE '%Gemini%'
         OR service.description LIKE '%AI Platform%'
         OR service.description LIKE '%Vertex%'
+    )
     AND DATE(usage_start_time) >= DATE_SUB(CURRENT_DATE(), INTERVAL {days} DAY)
-    ORDER BY usage_start_time DESC
-    LIMIT 1000
+    GROUP BY sku_description, category
+    ORDER BY total_cost DESC
     """
-    
+
+
+def query_gemini_costs(days: int = 30) -> None:
+    """Query Gemini API costs from BigQuery billing export."""
+    # Imported here so the query builder is usable without the BigQuery client
+    from google.cloud import bigquery
+
+    client = bigquery.Client(project=PROJECT_ID)
+
+    print(f"📊 Querying Gemini costs for last {days} days...")
+    query = _build_cost_query(days)
+
     try:
-        results = list(client.query(query).result())
+        results = _fetch_rows(client, query)
         
         if not results:
             print("   No Gemini usage found in the specified period.")
             print("   (Data may still be processing)")
             return
-            
-        # Aggregate by SKU
-        sku_totals = {}
-        for row in results:
-            sku = row.sku or "Unknown"
-            if sku not in sku_totals:
-                sku_totals[sku] = {"cost": 0, "usage": 0, "unit": row.usage_unit}
-            sku_totals[sku]["cost"] += float(row.cost or 0)
-            sku_totals[sku]["usage"] += float(row.usage_amount or 0)
         
         print("\n" + "=" * 70)
         print("GEMINI API USAGE BREAKDOWN")
@@ -105,24 +91,23 @@ def query_gemini_costs(days: int = 30) -> None:
         input_cost = 0
         output_cost = 0
         
-        for sku, data in sorted(sku_totals.items(), key=lambda x: -x[1]["cost"]):
-            cost = data["cost"]
+        for row in results:
+            cost = float(row["total_cost"] or 0)
+            usage = float(row["usage_amount"] or 0)
             total_cost += cost
             
-            # Categorize as input or output
-            sku_lower = sku.lower()
-            if "input" in sku_lower or "prompt" in sku_lower:
+            if row["category"] == "input":
                 input_cost += cost
                 category = "📥 INPUT"
-            elif "output" in sku_lower or "response" in sku_lower or "completion" in sku_lower:
+            elif row["category"] == "output":
                 output_cost += cost
                 category = "📤 OUTPUT"
             else:
                 category = "❓ OTHER"
             
-            usage_str = f"{data['usage']:,.0f} {data['unit']}" if data['usage'] else "N/A"
+            usage_str = f"{usage:,.0f} {row['usage_unit']}" if usage else "N/A"
             print(f"\n{category}")
-            print(f"  SKU: {sku}")
+            print(f"  SKU: {row['sku_description']}")
             print(f"  Usage: {usage_str}")
             print(f"  Cost: ${cost:.4f}")
         
@@ -140,6 +125,15 @@ def query_gemini_costs(days: int = 30) -> None:
             print(f"\n  Ratio: {input_pct:.1f}% input / {output_pct:.1f}% output")
             
     except Exception as e:
+        if "Not found" in str(e) or "does not match any table" in str(e):
+            print("\n⚠️  No billing export tables found yet.")
+            print("   This usually means:")
+            print("   1. Billing export not enabled yet")
+            print("   2. Data hasn't been exported yet (takes 24-48 hours)")
+            print("\n   Enable at: https://console.cloud.google.com/billing/01D2F4-3F2B44-2B0851/export")
+            print(f"   Select project: {PROJECT_ID}")
+            print(f"   Select dataset: {DATASET_ID}")
+            return
         print(f"\n❌ Query error: {e}")
         if "does not exist" in str(e).lower():
             print("   The billing export table structure may be different.")
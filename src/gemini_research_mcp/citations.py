@@ -7,6 +7,7 @@ vertexaisearch redirect URLs. This module extracts and resolves them.
 
 from __future__ import annotations
 
+import asyncio
 import re
 from urllib.parse import urlparse
 
@@ -17,6 +18,9 @@ from gemini_research_mcp.types import DeepResearchResult, ParsedCitation
 
 TRUSTED_REDIRECT_HOSTS: frozenset[str] = frozenset({"vertexaisearch.cloud.google.com"})
 
+# Maximum number of redirect URLs resolved at the same time
+RESOLVE_CONCURRENCY = 10
+
 
 def is_trusted_redirect_url(redirect_url: str) -> bool:
     """Return True when a redirect URL comes from a trusted Google redirect host."""
@@ -155,11 +159,18 @@ def extract_citations_from_text(text: str) -> tuple[str, list[ParsedCitation]]:
 async def resolve_citation_urls(
     citations: list[ParsedCitation],
     timeout: float = 5.0,
+    concurrency: int = RESOLVE_CONCURRENCY,
 ) -> list[ParsedCitation]:
-    """Resolve all redirect URLs in citations to get real destination URLs and page titles."""
-    for citation in citations:
+    """Resolve all redirect URLs in citations to get real destination URLs and page titles.
+
+    Redirects are resolved concurrently, with at most ``concurrency`` requests in flight.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _resolve(citation: ParsedCitation) -> None:
         if citation.redirect_url and is_trusted_redirect_url(citation.redirect_url):
-            url, title = await resolve_redirect_url(citation.redirect_url, timeout)
+            async with semaphore:
+                url, title = await resolve_redirect_url(citation.redirect_url, timeout)
             citation.url = url
             citation.title = citation.domain if is_blocked_page_title(title) else title
 
@@ -167,6 +178,8 @@ async def resolve_citation_urls(
                 citation.url = f"https://{citation.domain}"
         elif citation.redirect_url and "vertexaisearch" in citation.redirect_url.lower():
             citation.url = f"https://{citation.domain}"
+
+    await asyncio.gather(*(_resolve(citation) for citation in citations))
     return citations
 
 
@@ -15,10 +15,10 @@ import json
 import logging
 from dataclasses import dataclass, field
 
-from google import genai
 from google.genai.types import GenerateContentConfig
 
-from gemini_research_mcp.config import LOGGER_NAME, get_api_key
+from gemini_research_mcp.config import LOGGER_NAME
+from gemini_research_mcp.quick import get_client
 
 logger = logging.getLogger(LOGGER_NAME)
 
@@ -147,7 +147,7 @@ async def analyze_query(query: str) -> QueryAnalysis:
     Returns:
         QueryAnalysis with confidence score and optional questions
     """
-    client = genai.Client(api_key=get_api_key())
+    client = get_client()
 
     logger.debug("Analyzing query for clarification needs: %s", query[:100])
 
@@ -279,7 +279,7 @@ async def refine_query_with_answers(
 
     context_text = "\n\n".join(qa_pairs)
 
-    client = genai.Client(api_key=get_api_key())
+    client = get_client()
 
     refine_prompt = f"""\
 Given this original research query and the user's clarifying answers, \
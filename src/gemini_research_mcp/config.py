@@ -7,8 +7,10 @@ All configuration is loaded from environment variables with sensible defaults.
 from __future__ import annotations
 
 import os
+import re
 import tempfile
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 
 from gemini_research_mcp.types import DeepResearchAgent
@@ -28,6 +30,19 @@ LOGGER_NAME = "gemini-research-mcp"
 DEFAULT_MODEL = "gemini-3.1-pro-preview"
 # Interactions Deep Research agent.
 DEFAULT_DEEP_RESEARCH_AGENT = DeepResearchAgent.DEEP_RESEARCH
+# DEEP_RESEARCH_AGENT values (lower-cased) and the agent each one selects
+_DEEP_RESEARCH_AGENT_ALIASES: dict[str, DeepResearchAgent] = {
+    "fast": DeepResearchAgent.DEEP_RESEARCH,
+    "standard": DeepResearchAgent.DEEP_RESEARCH,
+    "deep-research": DeepResearchAgent.DEEP_RESEARCH,
+    DeepResearchAgent.DEEP_RESEARCH.value: DeepResearchAgent.DEEP_RESEARCH,
+    "max": DeepResearchAgent.DEEP_RESEARCH_MAX,
+    "deep-research-max": DeepResearchAgent.DEEP_RESEARCH_MAX,
+    DeepResearchAgent.DEEP_RESEARCH_MAX.value: DeepResearchAgent.DEEP_RESEARCH_MAX,
+    "pro": DeepResearchAgent.DEEP_RESEARCH_PRO,
+    "deep-research-pro": DeepResearchAgent.DEEP_RESEARCH_PRO,
+    DeepResearchAgent.DEEP_RESEARCH_PRO.value: DeepResearchAgent.DEEP_RESEARCH_PRO,
+}
 # Model for generating summaries (fast, cheap)
 DEFAULT_SUMMARY_MODEL = "gemini-3-flash-preview"
 
@@ -45,7 +60,12 @@ DEFAULT_THINKING_LEVEL = "high"
 # =============================================================================
 
 # Deep Research configuration
-STREAM_POLL_INTERVAL = 10.0  # seconds between polls
+STREAM_POLL_INTERVAL = 10.0  # seconds to wait after a retryable polling error
+# Adaptive post-stream polling: dense right after a status change, backing off when quiet
+POLL_MIN_INTERVAL = 0.5  # delay after the first poll or any status change
+POLL_MAX_INTERVAL = 30.0  # ceiling for the backed-off delay
+POLL_BACKOFF = 1.5  # multiplier applied while status is unchanged
+POLL_JITTER = 0.2  # +/- fraction of random jitter on each sleep
 MAX_POLL_TIME = 3600.0  # 60 minutes max wait
 DEFAULT_TIMEOUT = 3600.0  # 60 minutes default timeout
 RECONNECT_DELAY = 2.0  # Initial delay before reconnection
@@ -57,12 +77,20 @@ INITIAL_RETRY_BACKOFF = 1.5  # Exponential backoff multiplier for initial retrie
 MAX_STREAM_RETRIES = 10  # Maximum reconnection attempts after stream established
 MAX_STREAM_RETRY_DELAY = 60.0  # Maximum delay between stream reconnection attempts
 STREAM_RETRY_BACKOFF = 1.5  # Exponential backoff multiplier for stream retries
+RETRY_JITTER = 0.2  # +/- fraction of random jitter on each reconnect wait
+
+# Text delta coalescing: merge consecutive report deltas into one progress event
+TEXT_COALESCE_CHARS = 4096  # flush once the buffered text reaches this many characters
+TEXT_COALESCE_SECONDS = 0.02  # flush once the oldest buffered delta is this old
 
 # Client health monitoring (for long-running servers)
 # Refresh triggers: age > max, requests >= max, failures >= 3, or idle > max/2
 CLIENT_MAX_AGE_SECONDS = 3600.0  # Max client age (1 hour); also refreshes if idle > 30min
 CLIENT_MAX_REQUESTS = 100  # Recreate client after N requests (0 = disabled)
 
+# Exact-match response cache for deep_research / research_followup (opt-in)
+RESPONSE_CACHE_MAX_ENTRIES = 128  # oldest entries are evicted beyond this
+
 # Errors that should trigger reconnection
 RETRYABLE_ERRORS = [
     "gateway_timeout",
@@ -74,6 +102,8 @@ RETRYABLE_ERRORS = [
     "internal_error",
     "service_unavailable",
 ]
+# All markers in one case-insensitive pass, without lower-casing the message
+_RETRYABLE_ERROR_RE = re.compile("|".join(map(re.escape, RETRYABLE_ERRORS)), re.IGNORECASE)
 
 
 # =============================================================================
@@ -106,25 +136,24 @@ def get_deep_research_agent() -> DeepResearchAgent:
     if not raw:
         return DEFAULT_DEEP_RESEARCH_AGENT
     normalized = raw.strip().lower()
-    aliases = {
-        "fast": DeepResearchAgent.DEEP_RESEARCH,
-        "standard": DeepResearchAgent.DEEP_RESEARCH,
-        "deep-research": DeepResearchAgent.DEEP_RESEARCH,
-        DeepResearchAgent.DEEP_RESEARCH.value: DeepResearchAgent.DEEP_RESEARCH,
-        "max": DeepResearchAgent.DEEP_RESEARCH_MAX,
-        "deep-research-max": DeepResearchAgent.DEEP_RESEARCH_MAX,
-        DeepResearchAgent.DEEP_RESEARCH_MAX.value: DeepResearchAgent.DEEP_RESEARCH_MAX,
-        "pro": DeepResearchAgent.DEEP_RESEARCH_PRO,
-        "deep-research-pro": DeepResearchAgent.DEEP_RESEARCH_PRO,
-        DeepResearchAgent.DEEP_RESEARCH_PRO.value: DeepResearchAgent.DEEP_RESEARCH_PRO,
-    }
     try:
-        return aliases[normalized]
+        return _DEEP_RESEARCH_AGENT_ALIASES[normalized]
     except KeyError as exc:
-        valid = ", ".join(sorted(aliases))
+        valid = ", ".join(sorted(_DEEP_RESEARCH_AGENT_ALIASES))
         raise ValueError(f"Invalid DEEP_RESEARCH_AGENT '{raw}'. Use one of: {valid}") from exc
 
 
+def get_response_cache_ttl() -> float:
+    """Get the response cache TTL in seconds (0 disables the cache, the default)."""
+    raw = os.environ.get("GEMINI_RESEARCH_CACHE_TTL_SECONDS")
+    if not raw:
+        return 0.0
+    try:
+        return max(0.0, float(raw))
+    except ValueError as exc:
+        raise ValueError(f"Invalid GEMINI_RESEARCH_CACHE_TTL_SECONDS '{raw}'") from exc
+
+
 def get_summary_model() -> str:
     """Get model for generating summaries (fast, cheap)."""
     return os.environ.get("GEMINI_SUMMARY_MODEL", DEFAULT_SUMMARY_MODEL)
@@ -172,14 +201,10 @@ def get_export_dir() -> Path:
 
 def is_retryable_error(error_msg: str) -> bool:
     """Check if an error message indicates a retryable condition."""
-    error_lower = str(error_msg).lower()
-    return any(err in error_lower for err in RETRYABLE_ERRORS)
+    return _RETRYABLE_ERROR_RE.search(str(error_msg)) is not None
 
 
-def default_system_prompt() -> str:
-    """Default system prompt for research tasks."""
-    today = date.today().strftime("%B %d, %Y")
-    return f"""You are an expert research analyst. Today is {today}.
+_SYSTEM_PROMPT_TEMPLATE = """You are an expert research analyst. Today is {today}.
 
 When answering questions:
 1. Provide accurate, well-researched information grounded in your search results
@@ -190,3 +215,15 @@ When answering questions:
 
 Your goal is to provide comprehensive, factual answers that would satisfy
 a professional researcher."""
+
+
+@lru_cache(maxsize=1)
+def _system_prompt_for(day_ordinal: int) -> str:
+    """Render the system prompt for a given day (cached until the date changes)."""
+    today = date.fromordinal(day_ordinal).strftime("%B %d, %Y")
+    return _SYSTEM_PROMPT_TEMPLATE.format(today=today)
+
+
+def default_system_prompt() -> str:
+    """Default system prompt for research tasks."""
+    return _system_prompt_for(date.today().toordinal())
@@ -7,11 +7,18 @@ from URLs as clean Markdown, using trafilatura for high-quality extraction.
 Security: Blocks requests to private IPs, localhost, and cloud metadata endpoints.
 """
 
+import asyncio
 import ipaddress
 import logging
 import os
+import re
 import socket
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from functools import lru_cache
+from html.parser import HTMLParser
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
@@ -19,6 +26,23 @@ import httpx
 
 from gemini_research_mcp.config import LOGGER_NAME
 
+# Optional extractors (the "web" extra), imported once rather than per fetch
+try:
+    import trafilatura
+    from trafilatura.settings import DEFAULT_CONFIG as TRAFILATURA_CONFIG
+    from trafilatura.utils import load_html
+
+    _HAS_TRAFILATURA = True
+except ImportError:
+    _HAS_TRAFILATURA = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+
+    _HAS_SELECTOLAX = True
+except ImportError:
+    _HAS_SELECTOLAX = False
+
 logger = logging.getLogger(LOGGER_NAME)
 
 # =============================================================================
@@ -52,65 +76,151 @@ BLOCKED_PREFIXES: tuple[str, ...] = (
     "fe80:",  # IPv6 link-local
     "fc",  # IPv6 unique local (fc00::/7)
 )
+# Lower-cased once so str.startswith can test every prefix in a single call
+_BLOCKED_PREFIXES_LOWER: tuple[str, ...] = tuple(prefix.lower() for prefix in BLOCKED_PREFIXES)
 
 
 NAT64_WELL_KNOWN_PREFIX = ipaddress.ip_network("64:ff9b::/96")
 
+# Blocked-host verdicts, keyed by lower-cased hostname: (expires_at, is_private).
+# Public verdicts are never cached: a host that resolved public once must be
+# re-checked, or a DNS-rebinding domain would stay trusted for the whole TTL.
+DNS_CACHE_TTL = 300.0
+DNS_CACHE_MAX_ENTRIES = 1024
+_dns_cache: dict[str, tuple[float, bool]] = {}
+
+
+def _is_blocked_host_name(host_lower: str) -> bool:
+    """Check a lower-cased host against the static blocklists (no DNS)."""
+    return host_lower in BLOCKED_HOSTS or host_lower.startswith(_BLOCKED_PREFIXES_LOWER)
+
+
+@lru_cache(maxsize=1024)
+def _is_private_address(ip_str: str) -> bool:
+    """Classify one resolved address string (memoized; the rules never change)."""
+    try:
+        ip = ipaddress.ip_address(ip_str)
+    except ValueError:
+        return False
+    if ip.is_private or ip.is_loopback or ip.is_link_local:
+        return True
+    return ip.is_reserved and not (ip.version == 6 and ip in NAT64_WELL_KNOWN_PREFIX)
+
+
+def _resolves_to_private(addrs: list[tuple[Any, ...]]) -> bool:
+    """Return True if any getaddrinfo result points at a private/internal address."""
+    # getaddrinfo can repeat an address across families/protocols; classify each once
+    return any(_is_private_address(ip_str) for ip_str in {addr_info[4][0] for addr_info in addrs})
+
+
+def _cached_verdict(host_lower: str, now: float) -> bool | None:
+    """Return a fresh cached DNS verdict for a host, or None if absent/expired."""
+    cached = _dns_cache.get(host_lower)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    return None
+
+
+def _store_verdict(host_lower: str, verdict: bool, now: float) -> None:
+    """Cache a blocked verdict, pruning expired then oldest entries at capacity."""
+    if not verdict:
+        return
+    if len(_dns_cache) >= DNS_CACHE_MAX_ENTRIES:
+        for key in [k for k, (expires_at, _) in _dns_cache.items() if expires_at <= now]:
+            del _dns_cache[key]
+        while len(_dns_cache) >= DNS_CACHE_MAX_ENTRIES:
+            del _dns_cache[next(iter(_dns_cache))]
+    _dns_cache[host_lower] = (now + DNS_CACHE_TTL, verdict)
+
 
 def is_private_ip(host: str) -> bool:
     """Check if a host resolves to a private IP address."""
-    # Check blocked hosts first
-    if host.lower() in BLOCKED_HOSTS:
+    host_lower = host.lower()
+    if _is_blocked_host_name(host_lower):
         return True
 
-    # Check blocked prefixes
-    if any(host.lower().startswith(prefix.lower()) for prefix in BLOCKED_PREFIXES):
-        return True
+    now = time.monotonic()
+    cached = _cached_verdict(host_lower, now)
+    if cached is not None:
+        return cached
 
     # Try to resolve and check the IP
     try:
-        # Get all IPs for the host
         addrs = socket.getaddrinfo(host, None, socket.AF_UNSPEC, socket.SOCK_STREAM)
-        for addr_info in addrs:
-            ip_str = addr_info[4][0]
-            try:
-                ip = ipaddress.ip_address(ip_str)
-                if ip.is_private or ip.is_loopback or ip.is_link_local:
-                    return True
-                if ip.is_reserved and not (ip.version == 6 and ip in NAT64_WELL_KNOWN_PREFIX):
-                    return True
-            except ValueError:
-                continue
     except socket.gaierror:
-        # DNS resolution failed - might be suspicious, but allow for now
-        pass
+        # DNS resolution failed - might be suspicious, but allow for now (not cached)
+        return False
 
-    return False
+    verdict = _resolves_to_private(addrs)
+    _store_verdict(host_lower, verdict, now)
+    return verdict
 
 
-def validate_url(url: str) -> tuple[bool, str]:
+async def is_private_ip_async(host: str) -> bool:
+    """Async variant of is_private_ip that does not block the event loop.
+
+    Resolution runs through the loop's getaddrinfo (thread-pool dispatched).
+    Both variants share the cache of blocked hosts (DNS_CACHE_TTL seconds).
     """
-    Validate a URL for SSRF safety.
+    host_lower = host.lower()
+    if _is_blocked_host_name(host_lower):
+        return True
 
-    Returns (is_valid, error_message).
+    now = time.monotonic()
+    cached = _cached_verdict(host_lower, now)
+    if cached is not None:
+        return cached
+
+    try:
+        addrs = await asyncio.get_running_loop().getaddrinfo(
+            host, None, family=socket.AF_UNSPEC, type=socket.SOCK_STREAM
+        )
+    except socket.gaierror:
+        # DNS resolution failed - might be suspicious, but allow for now (not cached)
+        return False
+
+    verdict = _resolves_to_private(addrs)
+    _store_verdict(host_lower, verdict, now)
+    return verdict
+
+
+@lru_cache(maxsize=4096)
+def _parse_hostname(url: str) -> tuple[str | None, str]:
+    """Parse a URL and return (hostname, error_message) for the scheme/host checks.
+
+    Memoized per URL: the result depends only on the string, unlike the DNS
+    verdict, which is re-resolved unless _dns_cache holds a blocked entry.
     """
     try:
         parsed = urlparse(url)
     except Exception as e:
-        return False, f"Invalid URL: {e}"
+        return None, f"Invalid URL: {e}"
 
     # Must have scheme and host
     if not parsed.scheme or not parsed.netloc:
-        return False, "URL must have scheme (http/https) and host"
+        return None, "URL must have scheme (http/https) and host"
 
     # Only allow http/https
     if parsed.scheme.lower() not in ("http", "https"):
-        return False, f"Unsupported scheme: {parsed.scheme}. Only http/https allowed."
+        return None, f"Unsupported scheme: {parsed.scheme}. Only http/https allowed."
 
     # Extract hostname
     hostname = parsed.hostname
     if not hostname:
-        return False, "URL must have a valid hostname"
+        return None, "URL must have a valid hostname"
+
+    return hostname, ""
+
+
+def validate_url(url: str) -> tuple[bool, str]:
+    """
+    Validate a URL for SSRF safety.
+
+    Returns (is_valid, error_message).
+    """
+    hostname, error_msg = _parse_hostname(url)
+    if hostname is None:
+        return False, error_msg
 
     # Check for private IPs
     if is_private_ip(hostname):
@@ -119,6 +229,23 @@ def validate_url(url: str) -> tuple[bool, str]:
     return True, ""
 
 
+async def validate_url_async(url: str) -> tuple[bool, str]:
+    """
+    Validate a URL for SSRF safety without blocking the event loop.
+
+    Returns (is_valid, error_message).
+    """
+    hostname, error_msg = _parse_hostname(url)
+    if hostname is None:
+        return False, error_msg
+
+    # Check for private IPs
+    if await is_private_ip_async(hostname):
+        return False, f"SSRF blocked: {hostname} resolves to private/internal address"
+
+    return True, ""
+
+
 def validate_proxy_url(proxy_url: str) -> tuple[bool, str]:
     """Validate outbound proxy URL with SSRF safeguards.
 
@@ -131,6 +258,14 @@ def validate_proxy_url(proxy_url: str) -> tuple[bool, str]:
     return True, ""
 
 
+async def validate_proxy_url_async(proxy_url: str) -> tuple[bool, str]:
+    """Validate outbound proxy URL without blocking the event loop."""
+    is_valid, error_msg = await validate_url_async(proxy_url)
+    if not is_valid:
+        return False, f"Invalid proxy_url: {error_msg}"
+    return True, ""
+
+
 # =============================================================================
 # Content Extraction
 # =============================================================================
@@ -138,6 +273,7 @@ def validate_proxy_url(proxy_url: str) -> tuple[bool, str]:
 # HTTP client configuration
 FETCH_TIMEOUT = 15.0
 MAX_RESPONSE_SIZE = 10 * 1024 * 1024  # 10MB max
+FETCH_CHUNK_SIZE = 64 * 1024
 MAX_REDIRECTS = 5
 REDIRECT_STATUS_CODES = (301, 302, 303, 307, 308)
 
@@ -147,11 +283,34 @@ USER_AGENT = (
 )
 ROBOTS_TIMEOUT = 5.0
 
+# Keep-alive pool shared by fetch_webpage calls (TLS handshakes are amortized)
+FETCH_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+# Shared fetch client for direct / FETCH_PROXY_URL connections, bound to the
+# event loop and proxy it was created for. Caller-supplied proxies get a
+# per-call client instead, so arbitrary proxy strings cannot pile up sockets.
+_fetch_client: httpx.AsyncClient | None = None
+_fetch_client_key: tuple[asyncio.AbstractEventLoop, str | None] | None = None
+
+# Fallback text extraction: elements dropped entirely, and elements ending a line
+_SKIP_TAGS: frozenset[str] = frozenset({"script", "style", "nav", "header", "footer", "aside"})
+_BLOCK_TAGS: frozenset[str] = frozenset(
+    {"p", "div", "br", "h1", "h2", "h3", "h4", "h5", "h6", "li"}
+)
+_BLOCK_TAGS_SELECTOR = ", ".join(sorted(_BLOCK_TAGS))
+_INLINE_WS = re.compile(r"[^\S\n]+")
+_NL_PADDING = re.compile(r" ?\n ?")
+_MULTI_NL = re.compile(r"\n{3,}")
+
 # robots.txt cache by origin, value is parsed Protego object or None (allow by fallback)
 _ROBOTS_CACHE: dict[str, Any | None] = {}
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FetchResult:
     """Result of fetching webpage content."""
 
@@ -164,6 +323,58 @@ class FetchResult:
     error: str | None = None
 
 
+def _new_fetch_client(proxy_url: str | None) -> httpx.AsyncClient:
+    """Create a fetch client; redirects stay disabled so every hop is vetted."""
+    return httpx.AsyncClient(
+        timeout=FETCH_TIMEOUT,
+        follow_redirects=False,
+        headers={"User-Agent": USER_AGENT},
+        proxy=proxy_url,
+        limits=FETCH_POOL_LIMITS,
+    )
+
+
+async def _get_fetch_client(proxy_url: str | None) -> httpx.AsyncClient:
+    """Get the pooled fetch client for the running loop, creating it on first use.
+
+    A client's connections belong to the loop that opened them, so a new loop
+    (or a changed FETCH_PROXY_URL) gets a new client.
+    """
+    global _fetch_client, _fetch_client_key
+
+    loop = asyncio.get_running_loop()
+    key = (loop, proxy_url)
+    if _fetch_client is None or _fetch_client_key != key:
+        old_client, old_key = _fetch_client, _fetch_client_key
+        _fetch_client = _new_fetch_client(proxy_url)
+        _fetch_client_key = key
+        # A client from another loop cannot be closed here; it is dropped instead
+        if old_client is not None and old_key is not None and old_key[0] is loop:
+            await old_client.aclose()
+    return _fetch_client
+
+
+@asynccontextmanager
+async def _fetch_client_for(proxy_url: str | None) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the pooled client, or a per-call client for a caller-chosen proxy."""
+    if proxy_url is not None and proxy_url != os.environ.get("FETCH_PROXY_URL"):
+        async with _new_fetch_client(proxy_url) as client:
+            yield client
+    else:
+        yield await _get_fetch_client(proxy_url)
+
+
+async def close_fetch_clients() -> None:
+    """Close the pooled fetch client (called on server shutdown)."""
+    global _fetch_client, _fetch_client_key
+
+    client, key = _fetch_client, _fetch_client_key
+    _fetch_client = None
+    _fetch_client_key = None
+    if client is not None and key is not None and key[0] is asyncio.get_running_loop():
+        await client.aclose()
+
+
 def _get_redirect_target(response: httpx.Response) -> str | None:
     """Return the absolute redirect target for a response, if any."""
     if response.status_code not in REDIRECT_STATUS_CODES:
@@ -181,19 +392,32 @@ async def get_with_safe_redirects(
     url: str,
     *,
     max_redirects: int = MAX_REDIRECTS,
+    stream: bool = False,
 ) -> httpx.Response:
-    """Fetch a URL while validating every redirect target against SSRF rules."""
+    """Fetch a URL while validating every redirect target against SSRF rules.
+
+    With stream=True the final response body is left unread; the caller must
+    consume it and call ``aclose()``.
+    """
     current_url = url
     visited_urls = {url}
     redirects_followed = 0
 
     while True:
-        response = await client.get(current_url)
+        if stream:
+            request = client.build_request("GET", current_url)
+            response = await client.send(request, stream=True)
+        else:
+            response = await client.get(current_url)
 
         redirect_target = _get_redirect_target(response)
         if redirect_target is None:
             return response
 
+        if stream:
+            # Redirect bodies are never read; release the connection right away
+            await response.aclose()
+
         redirects_followed += 1
         if redirects_followed > max_redirects:
             raise ValueError(f"Too many redirects (max: {max_redirects})")
@@ -201,7 +425,7 @@ async def get_with_safe_redirects(
         if redirect_target in visited_urls:
             raise ValueError("Redirect loop detected")
 
-        is_valid, error_msg = validate_url(redirect_target)
+        is_valid, error_msg = await validate_url_async(redirect_target)
         if not is_valid:
             raise ValueError(f"Unsafe redirect blocked: {error_msg}")
 
@@ -280,6 +504,96 @@ def _slice_content(content: str, start_index: int, max_length: int | None) -> tu
     return sliced[:max_length], end_index < total_length, total_length
 
 
+def _build_fetch_result(
+    url: str,
+    title: str | None,
+    text: str,
+    *,
+    start_index: int,
+    max_length: int | None,
+    extractor: str,
+) -> FetchResult:
+    """Chunk extracted text, count its words once, and wrap it in a FetchResult."""
+    content, is_truncated, total_length = _slice_content(
+        text,
+        start_index=start_index,
+        max_length=max_length,
+    )
+
+    # str.split() counts in C; list-free regex counting measured ~5x slower
+    word_count = len(content.split())
+    logger.info("   ✅ Extracted %d words via %s", word_count, extractor)
+
+    return FetchResult(
+        url=url,
+        title=title,
+        content=content,
+        word_count=word_count,
+        is_truncated=is_truncated,
+        total_content_length=total_length,
+    )
+
+
+class _TextExtractor(HTMLParser):
+    """Minimal html.parser text extractor used when no other extractor is available."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.text_parts: list[str] = []
+        self.title: str | None = None
+        self._in_title = False
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "title":
+            self._in_title = True
+        elif tag in _SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title":
+            self._in_title = False
+        elif tag in _SKIP_TAGS and self._skip_depth > 0:
+            self._skip_depth -= 1
+        elif tag in _BLOCK_TAGS:
+            self.text_parts.append("\n")
+
+    def handle_data(self, data: str) -> None:
+        text = data.strip()
+        if not text:
+            return
+        if self._in_title:
+            self.title = text
+        elif self._skip_depth == 0:
+            self.text_parts.append(text + " ")
+
+
+def _extract_text_lexbor(html: str) -> tuple[str | None, str] | None:
+    """Extract (title, text) with selectolax's lexbor parser.
+
+    Returns None when selectolax is not installed.
+    """
+    if not _HAS_SELECTOLAX:
+        return None
+
+    tree = LexborHTMLParser(html)
+    title_node = tree.css_first("title")
+    title = (title_node.text(strip=True) or None) if title_node else None
+
+    tree.strip_tags(list(_SKIP_TAGS))
+    body = tree.body
+    if body is None:
+        return title, ""
+
+    # Mirror the html.parser fallback: a line break after each block element
+    for node in body.css(_BLOCK_TAGS_SELECTOR):
+        node.insert_after("\n")
+
+    text = _INLINE_WS.sub(" ", body.text(separator=" ", strip=False))
+    text = _NL_PADDING.sub("\n", text)
+    return title, _MULTI_NL.sub("\n\n", text).strip()
+
+
 async def fetch_webpage(
     url: str,
     *,
@@ -291,7 +605,7 @@ async def fetch_webpage(
     Fetch and extract content from a webpage as Markdown.
 
     Uses trafilatura for high-quality content extraction (F1: 0.937).
-    Falls back to basic HTML parsing if trafilatura is unavailable.
+    Falls back to selectolax, then to html.parser, if trafilatura is unavailable.
 
     Args:
         url: The URL to fetch
@@ -322,7 +636,7 @@ async def fetch_webpage(
     effective_proxy_url = proxy_url or os.environ.get("FETCH_PROXY_URL")
 
     if effective_proxy_url:
-        is_valid_proxy, proxy_error = validate_proxy_url(effective_proxy_url)
+        is_valid_proxy, proxy_error = await validate_proxy_url_async(effective_proxy_url)
         if not is_valid_proxy:
             return FetchResult(
                 url=url,
@@ -333,7 +647,7 @@ async def fetch_webpage(
             )
 
     # Validate URL for SSRF
-    is_valid, error_msg = validate_url(url)
+    is_valid, error_msg = await validate_url_async(url)
     if not is_valid:
         logger.warning("   ❌ SSRF blocked: %s", error_msg)
         return FetchResult(
@@ -361,29 +675,49 @@ async def fetch_webpage(
 
     # Fetch the page
     try:
-        async with httpx.AsyncClient(
-            timeout=FETCH_TIMEOUT,
-            follow_redirects=False,
-            headers={"User-Agent": USER_AGENT},
-            proxy=effective_proxy_url,
-        ) as client:
-            response = await get_with_safe_redirects(client, url)
-            response.raise_for_status()
-            response_url = str(response.url)
-
-            # Check content length
-            content_length = response.headers.get("content-length")
-            if content_length and int(content_length) > MAX_RESPONSE_SIZE:
-                size_mb = int(content_length) / 1024 / 1024
-                return FetchResult(
-                    url=url,
-                    title=None,
-                    content="",
-                    word_count=0,
-                    error=f"Content too large: {size_mb:.1f}MB (max: 10MB)",
-                )
-
-            html = response.text
+        async with _fetch_client_for(effective_proxy_url) as client:
+            response = await get_with_safe_redirects(client, url, stream=True)
+            try:
+                response.raise_for_status()
+                response_url = str(response.url)
+
+                # Check content length
+                content_length = response.headers.get("content-length")
+                if content_length and int(content_length) > MAX_RESPONSE_SIZE:
+                    size_mb = int(content_length) / 1024 / 1024
+                    return FetchResult(
+                        url=url,
+                        title=None,
+                        content="",
+                        word_count=0,
+                        error=(
+                            f"Content too large: {size_mb:.1f}MB "
+                            f"(max: {MAX_RESPONSE_SIZE / 1024 / 1024:g}MB)"
+                        ),
+                    )
+
+                # Stream the body so the cap also holds when Content-Length is absent
+                body = bytearray()
+                async for chunk in response.aiter_bytes(chunk_size=FETCH_CHUNK_SIZE):
+                    body.extend(chunk)
+                    if len(body) > MAX_RESPONSE_SIZE:
+                        logger.warning(
+                            "   ❌ Response exceeded %d bytes: %s", MAX_RESPONSE_SIZE, url
+                        )
+                        return FetchResult(
+                            url=url,
+                            title=None,
+                            content="",
+                            word_count=0,
+                            error=(
+                                "Content too large: exceeded "
+                                f"{MAX_RESPONSE_SIZE / 1024 / 1024:g}MB while streaming"
+                            ),
+                        )
+
+                html = body.decode(response.encoding or "utf-8", errors="replace")
+            finally:
+                await response.aclose()
 
     except httpx.TimeoutException:
         logger.warning("   ❌ Timeout fetching: %s", url)
@@ -414,111 +748,77 @@ async def fetch_webpage(
         )
 
     # Extract content using trafilatura (preferred)
-    try:
-        import trafilatura
-        from trafilatura.settings import DEFAULT_CONFIG
-
-        # Configure for Markdown output
-        extracted = trafilatura.extract(
-            html,
-            url=response_url,
-            output_format="markdown",
-            include_links=True,
-            include_images=False,
-            include_tables=True,
-            include_comments=False,
-            config=DEFAULT_CONFIG,
-        )
-
-        if extracted:
-            # Extract title separately
-            metadata = trafilatura.extract_metadata(html)
-            title = metadata.title if metadata else None
-
-            content, is_truncated, total_length = _slice_content(
-                extracted,
-                start_index=start_index,
-                max_length=max_length,
+    if not _HAS_TRAFILATURA:
+        logger.info("   ℹ️ trafilatura not installed, using basic extraction")
+    else:
+        try:
+            # Parse once; extract() and extract_metadata() both accept the lxml tree
+            tree = load_html(html)
+            if tree is None:
+                raise ValueError("HTML could not be parsed")
+
+            # Configure for Markdown output
+            extracted = trafilatura.extract(
+                tree,
+                url=response_url,
+                output_format="markdown",
+                include_links=True,
+                include_images=False,
+                include_tables=True,
+                include_comments=False,
+                config=TRAFILATURA_CONFIG,
             )
 
-            word_count = len(content.split())
-            logger.info("   ✅ Extracted %d words via trafilatura", word_count)
+            if extracted:
+                # Extract title separately
+                metadata = trafilatura.extract_metadata(tree)
+                title = metadata.title if metadata else None
+
+                return _build_fetch_result(
+                    response_url,
+                    title,
+                    extracted,
+                    start_index=start_index,
+                    max_length=max_length,
+                    extractor="trafilatura",
+                )
+            else:
+                logger.warning("   ⚠️ trafilatura returned empty, falling back")
 
-            return FetchResult(
-                url=response_url,
-                title=title,
-                content=content,
-                word_count=word_count,
-                is_truncated=is_truncated,
-                total_content_length=total_length,
-            )
-        else:
-            logger.warning("   ⚠️ trafilatura returned empty, falling back")
+        except Exception as e:
+            logger.warning("   ⚠️ trafilatura failed: %s, falling back", e)
 
-    except ImportError:
-        logger.info("   ℹ️ trafilatura not installed, using basic extraction")
+    # Fallback: selectolax (C-backed lexbor parser) when installed
+    try:
+        lexbor_result = _extract_text_lexbor(html)
     except Exception as e:
-        logger.warning("   ⚠️ trafilatura failed: %s, falling back", e)
+        logger.warning("   ⚠️ selectolax failed: %s, falling back", e)
+        lexbor_result = None
+
+    if lexbor_result is not None:
+        title, content = lexbor_result
+        return _build_fetch_result(
+            response_url,
+            title,
+            content,
+            start_index=start_index,
+            max_length=max_length,
+            extractor="selectolax",
+        )
 
-    # Fallback: Basic HTML to text using built-in html.parser
+    # Last resort: Basic HTML to text using built-in html.parser
     try:
-        from html.parser import HTMLParser
-
-        class TextExtractor(HTMLParser):
-            def __init__(self) -> None:
-                super().__init__()
-                self.text_parts: list[str] = []
-                self.title: str | None = None
-                self._in_title = False
-                self._skip_tags = {"script", "style", "nav", "header", "footer", "aside"}
-                self._skip_depth = 0
-
-            def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-                if tag == "title":
-                    self._in_title = True
-                elif tag in self._skip_tags:
-                    self._skip_depth += 1
-
-            def handle_endtag(self, tag: str) -> None:
-                if tag == "title":
-                    self._in_title = False
-                elif tag in self._skip_tags and self._skip_depth > 0:
-                    self._skip_depth -= 1
-                elif tag in ("p", "div", "br", "h1", "h2", "h3", "h4", "h5", "h6", "li"):
-                    self.text_parts.append("\n")
-
-            def handle_data(self, data: str) -> None:
-                text = data.strip()
-                if not text:
-                    return
-                if self._in_title:
-                    self.title = text
-                elif self._skip_depth == 0:
-                    self.text_parts.append(text + " ")
-
-        parser = TextExtractor()
+        parser = _TextExtractor()
         parser.feed(html)
-        content = "".join(parser.text_parts).strip()
-        # Clean up multiple newlines
-        while "\n\n\n" in content:
-            content = content.replace("\n\n\n", "\n\n")
+        content = _MULTI_NL.sub("\n\n", "".join(parser.text_parts).strip())
 
-        content, is_truncated, total_length = _slice_content(
+        return _build_fetch_result(
+            response_url,
+            parser.title,
             content,
             start_index=start_index,
             max_length=max_length,
-        )
-
-        word_count = len(content.split())
-        logger.info("   ✅ Basic extraction: %d words", word_count)
-
-        return FetchResult(
-            url=response_url,
-            title=parser.title,
-            content=content,
-            word_count=word_count,
-            is_truncated=is_truncated,
-            total_content_length=total_length,
+            extractor="html.parser",
         )
 
     except Exception as e:
@@ -534,10 +834,14 @@ async def fetch_webpage(
 
 __all__ = [
     "fetch_webpage",
+    "close_fetch_clients",
     "check_robots_txt",
     "FetchResult",
     "get_with_safe_redirects",
     "validate_url",
+    "validate_url_async",
     "validate_proxy_url",
+    "validate_proxy_url_async",
     "is_private_ip",
+    "is_private_ip_async",
 ]
@@ -8,12 +8,17 @@ Takes 3-20 minutes typically.
 from __future__ import annotations
 
 import asyncio
+import copy
+import hashlib
 import inspect
+import io
+import json
 import logging
+import random
 import time
 from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import dataclass, replace
+from typing import Any, cast
 
 from google import genai
 
@@ -29,11 +34,20 @@ from gemini_research_mcp.config import (
     MAX_POLL_TIME,
     MAX_STREAM_RETRIES,
     MAX_STREAM_RETRY_DELAY,
+    POLL_BACKOFF,
+    POLL_JITTER,
+    POLL_MAX_INTERVAL,
+    POLL_MIN_INTERVAL,
     RECONNECT_DELAY,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RETRY_JITTER,
     STREAM_POLL_INTERVAL,
     STREAM_RETRY_BACKOFF,
+    TEXT_COALESCE_CHARS,
+    TEXT_COALESCE_SECONDS,
     get_api_key,
     get_deep_research_agent,
+    get_response_cache_ttl,
     is_retryable_error,
 )
 from gemini_research_mcp.types import (
@@ -233,17 +247,25 @@ def build_interactions_tools(
 
 @dataclass
 class ClientHealth:
-    """Track client health for long-running servers."""
+    """Track client health for long-running servers.
 
-    created_at: float = field(default_factory=time.time)
+    Timestamps are time.monotonic() readings; they are only used for age math.
+    """
+
+    created_at: float = 0.0
     request_count: int = 0
-    last_request_at: float = field(default_factory=time.time)
+    last_request_at: float = 0.0
     consecutive_failures: int = 0
 
-    def record_request(self) -> None:
-        """Record a successful request."""
+    def __post_init__(self) -> None:
+        now = time.monotonic()
+        self.created_at = self.created_at or now
+        self.last_request_at = self.last_request_at or now
+
+    def record_request(self, now: float | None = None) -> None:
+        """Record a successful request (``now`` lets callers reuse a clock read)."""
         self.request_count += 1
-        self.last_request_at = time.time()
+        self.last_request_at = time.monotonic() if now is None else now
         self.consecutive_failures = 0
 
     def record_failure(self) -> None:
@@ -252,14 +274,11 @@ class ClientHealth:
 
     def needs_refresh(self) -> bool:
         """Check if client should be refreshed."""
-        age = time.time() - self.created_at
-        idle_time = time.time() - self.last_request_at
-
-        # Refresh if client is too old
-        if age > CLIENT_MAX_AGE_SECONDS:
+        # Refresh if too many consecutive failures (cheapest check, no clock read)
+        if self.consecutive_failures >= 3:
             logger.info(
-                "🔄 Client needs refresh: age=%.0fs > max=%.0fs",
-                age, CLIENT_MAX_AGE_SECONDS
+                "🔄 Client needs refresh: consecutive_failures=%d",
+                self.consecutive_failures
             )
             return True
 
@@ -271,15 +290,19 @@ class ClientHealth:
             )
             return True
 
-        # Refresh if too many consecutive failures
-        if self.consecutive_failures >= 3:
+        now = time.monotonic()
+
+        # Refresh if client is too old
+        age = now - self.created_at
+        if age > CLIENT_MAX_AGE_SECONDS:
             logger.info(
-                "🔄 Client needs refresh: consecutive_failures=%d",
-                self.consecutive_failures
+                "🔄 Client needs refresh: age=%.0fs > max=%.0fs",
+                age, CLIENT_MAX_AGE_SECONDS
             )
             return True
 
         # Refresh if idle for too long (half of max age)
+        idle_time = now - self.last_request_at
         if idle_time > CLIENT_MAX_AGE_SECONDS / 2:
             logger.info("🔄 Client needs refresh: idle_time=%.0fs", idle_time)
             return True
@@ -304,11 +327,11 @@ def _get_healthy_client() -> genai.Client:
     return _client
 
 
-def _record_client_success() -> None:
+def _record_client_success(now: float | None = None) -> None:
     """Record a successful client operation."""
     global _client_health
     if _client_health:
-        _client_health.record_request()
+        _client_health.record_request(now)
 
 
 def _record_client_failure() -> None:
@@ -326,6 +349,200 @@ def _force_client_refresh() -> None:
     _client_health = None
 
 
+# =============================================================================
+# Response Cache
+# =============================================================================
+
+
+class ResponseCache:
+    """In-memory exact-match cache for finished research responses.
+
+    Keys are SHA-256 digests of the JSON-encoded request parameters. Entries
+    expire ``ttl_seconds`` after they are stored; past ``max_entries`` the
+    oldest entry is evicted. Values are stored as given: callers caching
+    mutable results store and hand out copies (see _copy_result).
+
+    Used by deep_research and research_followup. The research_deep MCP tools
+    run deep_research_stream directly, so their reports are never cached.
+    """
+
+    def __init__(
+        self, ttl_seconds: float, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[str, tuple[float, Any]] = {}
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Hash request parameters into a cache key."""
+        return hashlib.sha256(json.dumps(parts, default=str).encode()).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the oldest entries beyond max_entries."""
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
+_response_cache: ResponseCache | None = None
+
+
+def _copy_result(result: DeepResearchResult) -> DeepResearchResult:
+    """Copy a result's mutable containers for the response cache.
+
+    The live SDK interaction is dropped rather than copied: it can hold
+    clients and streams, and cache hits only need the serializable fields.
+    """
+    usage = result.usage
+    if usage is not None:
+        usage = replace(usage, raw_usage=copy.deepcopy(usage.raw_usage))
+    return replace(
+        result,
+        citations=list(result.citations),
+        parsed_citations=[replace(citation) for citation in result.parsed_citations],
+        thinking_summaries=list(result.thinking_summaries),
+        usage=usage,
+        raw_interaction=None,
+    )
+
+
+def _get_response_cache() -> ResponseCache | None:
+    """Get the response cache, or None when GEMINI_RESEARCH_CACHE_TTL_SECONDS is unset."""
+    global _response_cache
+
+    ttl = get_response_cache_ttl()
+    if ttl <= 0:
+        return None
+    if _response_cache is None or _response_cache.ttl_seconds != ttl:
+        _response_cache = ResponseCache(ttl)
+    return _response_cache
+
+
+# Retry waits per attempt: RECONNECT_DELAY * backoff**(attempt - 1), capped
+_INITIAL_BACKOFF_DELAYS = tuple(
+    min(RECONNECT_DELAY * INITIAL_RETRY_BACKOFF**i, MAX_INITIAL_RETRY_DELAY)
+    for i in range(MAX_INITIAL_RETRIES)
+)
+_STREAM_BACKOFF_DELAYS = tuple(
+    min(RECONNECT_DELAY * STREAM_RETRY_BACKOFF**i, MAX_STREAM_RETRY_DELAY)
+    for i in range(MAX_STREAM_RETRIES)
+)
+
+
+# Interaction statuses that end the post-stream poll loop
+_TERMINAL_STATUSES = frozenset({"completed", "cancelled", "canceled", "failed"})
+
+
+def _next_poll_delay(delay: float, *, status_changed: bool) -> float:
+    """Reset the poll delay on a status change, otherwise back off toward the ceiling."""
+    if status_changed:
+        return POLL_MIN_INTERVAL
+    return min(delay * POLL_BACKOFF, POLL_MAX_INTERVAL)
+
+
+def _jittered(delay: float, jitter: float) -> float:
+    """Spread a delay by +/- ``jitter`` (a fraction) so concurrent clients don't align.
+
+    Reconnect waits use RETRY_JITTER and status polls use POLL_JITTER.
+    """
+    return delay * (1 + random.uniform(-jitter, jitter))
+
+
+async def _coalesce_text_events(
+    events: AsyncIterator[DeepResearchProgress],
+) -> AsyncIterator[DeepResearchProgress]:
+    """Merge runs of consecutive text deltas into fewer progress events.
+
+    A run is flushed once it reaches TEXT_COALESCE_CHARS characters or is older
+    than TEXT_COALESCE_SECONDS, before any non-text event, and when the stream
+    ends or fails. The merged event keeps the id of the last delta in the run.
+
+    The age limit is checked as deltas arrive rather than on a timer: a run
+    buffered when generation pauses goes out with the next event. The stream
+    is iterated in the caller's task, so cancellation reaches it directly.
+    """
+    parts: list[str] = []
+    size = 0
+    started_at = 0.0
+    last: DeepResearchProgress | None = None
+
+    def flush(tail: DeepResearchProgress) -> DeepResearchProgress:
+        nonlocal size, last
+        merged = DeepResearchProgress(
+            event_type="text",
+            content="".join(parts),
+            interaction_id=tail.interaction_id,
+            event_id=tail.event_id,
+        )
+        parts.clear()
+        size = 0
+        last = None
+        return merged
+
+    try:
+        async for progress in events:
+            if progress.event_type != "text" or not progress.content:
+                if last is not None:
+                    yield flush(last)
+                yield progress
+                continue
+
+            if not parts:
+                started_at = time.monotonic()
+            parts.append(progress.content)
+            size += len(progress.content)
+            last = progress
+
+            if (
+                size >= TEXT_COALESCE_CHARS
+                or time.monotonic() - started_at >= TEXT_COALESCE_SECONDS
+            ):
+                yield flush(progress)
+    except Exception:
+        # Hand over buffered text before the disconnect reaches the retry logic
+        if last is not None:
+            yield flush(last)
+        raise
+
+    if last is not None:
+        yield flush(last)
+
+
+# Attribute names tried in order: google-genai field names first, then the
+# OpenAI-style aliases some interaction payloads use.
+_PROMPT_TOKEN_KEYS = ("prompt_token_count", "prompt_tokens")
+_COMPLETION_TOKEN_KEYS = ("candidates_token_count", "completion_tokens")
+_TOTAL_TOKEN_KEYS = ("total_token_count", "total_tokens")
+
+_MISSING = object()
+
+
+def _first_attr(obj: Any, keys: tuple[str, ...]) -> Any:
+    """Return the first attribute in ``keys`` that is set (not None) on ``obj``."""
+    for key in keys:
+        value = getattr(obj, key, None)
+        if value is not None:
+            return value
+    return None
+
+
 def _extract_usage(interaction: Any) -> DeepResearchUsage | None:
     """Extract usage/cost information from an interaction response."""
     usage_data = getattr(interaction, "usage_metadata", None)
@@ -336,44 +553,31 @@ def _extract_usage(interaction: Any) -> DeepResearchUsage | None:
     if usage_data is None:
         return None
 
-    prompt_tokens = getattr(usage_data, "prompt_token_count", None)
-    if prompt_tokens is None:
-        prompt_tokens = getattr(usage_data, "prompt_tokens", None)
-
-    completion_tokens = getattr(usage_data, "candidates_token_count", None)
-    if completion_tokens is None:
-        completion_tokens = getattr(usage_data, "completion_tokens", None)
-
-    total_tokens = getattr(usage_data, "total_token_count", None)
-    if total_tokens is None:
-        total_tokens = getattr(usage_data, "total_tokens", None)
-
-    raw_usage: dict[str, Any] = {}
-    if hasattr(usage_data, "__dict__"):
-        raw_usage = vars(usage_data)
-    elif hasattr(usage_data, "to_dict"):
-        raw_usage = usage_data.to_dict()
+    # Keep a reference to the live __dict__ (read-only use, never copied here);
+    # to_dict() is only needed for slotted objects
+    raw_usage = getattr(usage_data, "__dict__", None)
+    if raw_usage is None:
+        to_dict = getattr(usage_data, "to_dict", None)
+        raw_usage = to_dict() if callable(to_dict) else {}
 
     return DeepResearchUsage(
-        prompt_tokens=prompt_tokens,
-        completion_tokens=completion_tokens,
-        total_tokens=total_tokens,
+        prompt_tokens=_first_attr(usage_data, _PROMPT_TOKEN_KEYS),
+        completion_tokens=_first_attr(usage_data, _COMPLETION_TOKEN_KEYS),
+        total_tokens=_first_attr(usage_data, _TOTAL_TOKEN_KEYS),
         raw_usage=raw_usage,
     )
 
 
 def _extract_text_from_interaction(interaction: Any) -> str | None:
     """Extract the final text output from an interaction."""
-    outputs = getattr(interaction, "outputs", [])
-    if outputs:
-        last_output = outputs[-1]
-        if hasattr(last_output, "text"):
-            text = last_output.text
-            return str(text) if text is not None else None
-        if hasattr(last_output, "content"):
-            content = last_output.content
-            return str(content) if content is not None else None
-    return None
+    outputs = getattr(interaction, "outputs", None)
+    if not outputs:
+        return None
+    last_output = outputs[-1]
+    value = getattr(last_output, "text", _MISSING)
+    if value is _MISSING:
+        value = getattr(last_output, "content", None)
+    return str(value) if value is not None else None
 
 
 async def deep_research_stream(
@@ -435,21 +639,24 @@ async def deep_research_stream(
     if tools:
         create_kwargs["tools"] = tools
 
-    stream_start_time = time.time()
+    stream_start_time = time.monotonic()
 
-    logger.info("=" * 60)
-    logger.info("🔬 DEEP RESEARCH AGENT")
-    logger.info("   Agent: %s", agent_name)
-    logger.info("   Query: %s", query[:100])
-    logger.info("   Max initial retries: %d", MAX_INITIAL_RETRIES)
-    logger.info("   Max stream retries: %d", MAX_STREAM_RETRIES)
-    logger.info("=" * 60)
+    def _elapsed() -> float:
+        """Seconds since the stream started (monotonic, immune to wall-clock jumps)."""
+        return time.monotonic() - stream_start_time
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("=" * 60)
+        logger.info("🔬 DEEP RESEARCH AGENT")
+        logger.info("   Agent: %s", agent_name)
+        logger.info("   Query: %s", query[:100])
+        logger.info("   Max initial retries: %d", MAX_INITIAL_RETRIES)
+        logger.info("   Max stream retries: %d", MAX_STREAM_RETRIES)
+        logger.info("=" * 60)
 
     interaction_id: str | None = None
     last_event_id: str | None = None
     is_complete = False
-    initial_retry_delay = RECONNECT_DELAY
-    stream_retry_delay = RECONNECT_DELAY
     stream_retry_count = 0
     disconnect_count = 0
     received_any_event = False
@@ -458,43 +665,53 @@ async def deep_research_stream(
         """Process events from a stream (initial or resumed)."""
         nonlocal interaction_id, last_event_id, is_complete, received_any_event
 
+        debug = logger.isEnabledFor(logging.DEBUG)
         chunk_count = 0
         async for chunk in stream:
             chunk_count += 1
             received_any_event = True
-            elapsed = time.time() - stream_start_time
 
-            chunk_type = getattr(chunk, "event_type", "unknown")
-            logger.debug("[%.1fs] 📦 CHUNK #%d: type=%s", elapsed, chunk_count, chunk_type)
+            # Read the event type and id once; every branch below dispatches on them
+            event_type = getattr(chunk, "event_type", "unknown")
+            event_id = getattr(chunk, "event_id", None)
+            if debug:
+                logger.debug(
+                    "[%.1fs] 📦 CHUNK #%d: type=%s", _elapsed(), chunk_count, event_type
+                )
 
-            if chunk.event_type == "interaction.start":
+            if event_type == "interaction.start":
                 interaction_id = chunk.interaction.id
-                logger.info("[%.1fs] 🚀 interaction.start: id=%s", elapsed, interaction_id)
+                logger.info("[%.1fs] 🚀 interaction.start: id=%s", _elapsed(), interaction_id)
                 _record_client_success()  # Record successful API interaction
                 yield DeepResearchProgress(
                     event_type="start",
                     interaction_id=interaction_id,
-                    event_id=getattr(chunk, "event_id", None),
+                    event_id=event_id,
                 )
                 continue
 
-            if hasattr(chunk, "event_id") and chunk.event_id:
-                last_event_id = chunk.event_id
+            if event_id:
+                last_event_id = event_id
 
-            if chunk.event_type == "content.delta":
+            if event_type == "content.delta":
                 delta = chunk.delta
-                if delta.type == "thought_summary":
+                delta_type = delta.type
+                if delta_type == "thought_summary":
                     content = delta.content
                     thought_text = content.text if hasattr(content, "text") else str(content)
-                    logger.debug("[%.1fs] 🧠 thought_summary", elapsed)
+                    if debug:
+                        logger.debug("[%.1fs] 🧠 thought_summary", _elapsed())
                     yield DeepResearchProgress(
                         event_type="thought",
                         content=thought_text,
                         interaction_id=interaction_id,
                         event_id=last_event_id,
                     )
-                elif delta.type == "text":
-                    logger.debug("[%.1fs] 📝 text delta: %d chars", elapsed, len(delta.text))
+                elif delta_type == "text":
+                    if debug:
+                        logger.debug(
+                            "[%.1fs] 📝 text delta: %d chars", _elapsed(), len(delta.text)
+                        )
                     yield DeepResearchProgress(
                         event_type="text",
                         content=delta.text,
@@ -502,11 +719,11 @@ async def deep_research_stream(
                         event_id=last_event_id,
                     )
 
-            elif chunk.event_type == "interaction.complete":
+            elif event_type == "interaction.complete":
                 interaction = getattr(chunk, "interaction", None)
                 interaction_status = getattr(interaction, "status", "unknown")
                 logger.info(
-                    "[%.1fs] ✅ interaction.complete (status=%s)", elapsed, interaction_status
+                    "[%.1fs] ✅ interaction.complete (status=%s)", _elapsed(), interaction_status
                 )
 
                 if interaction_status == "completed":
@@ -520,7 +737,7 @@ async def deep_research_stream(
                     is_complete = True
                     logger.warning(
                         "[%.1fs] 🚫 interaction.complete: cancelled",
-                        elapsed,
+                        _elapsed(),
                     )
                     yield DeepResearchProgress(
                         event_type="error",
@@ -532,7 +749,7 @@ async def deep_research_stream(
                     is_complete = True
                     logger.error(
                         "[%.1fs] ❌ interaction.complete: failed",
-                        elapsed,
+                        _elapsed(),
                     )
                     yield DeepResearchProgress(
                         event_type="error",
@@ -543,14 +760,14 @@ async def deep_research_stream(
                 else:
                     logger.warning(
                         "[%.1fs] ⚠️ interaction.complete but status='%s'",
-                        elapsed,
+                        _elapsed(),
                         interaction_status,
                     )
 
-            elif chunk.event_type == "error":
+            elif event_type == "error":
                 is_complete = True
                 error_msg = getattr(chunk, "error", "Unknown error")
-                logger.error("[%.1fs] ❌ error: %s", elapsed, error_msg)
+                logger.error("[%.1fs] ❌ error: %s", _elapsed(), error_msg)
                 yield DeepResearchProgress(
                     event_type="error",
                     content=str(error_msg),
@@ -565,7 +782,7 @@ async def deep_research_stream(
 
     while initial_attempt < MAX_INITIAL_RETRIES:
         initial_attempt += 1
-        elapsed_t = time.time() - stream_start_time
+        elapsed_t = _elapsed()
 
         # Refresh client on each retry attempt to pick up health-based refreshes
         client = _get_healthy_client()
@@ -582,24 +799,23 @@ async def deep_research_stream(
                 _record_client_failure()
                 logger.warning(
                     "⏱️ [%.1fs] ⚠️ Stream returned None (attempt %d/%d)",
-                    time.time() - stream_start_time, initial_attempt, MAX_INITIAL_RETRIES
+                    _elapsed(), initial_attempt, MAX_INITIAL_RETRIES
                 )
                 # Exponential backoff for retries
-                backoff = INITIAL_RETRY_BACKOFF ** (initial_attempt - 1)
-                wait_time = min(initial_retry_delay * backoff, MAX_INITIAL_RETRY_DELAY)
+                wait_time = _jittered(_INITIAL_BACKOFF_DELAYS[initial_attempt - 1], RETRY_JITTER)
                 logger.info("   ⏳ Waiting %.1fs before retry...", wait_time)
                 await asyncio.sleep(wait_time)
                 continue
 
-            logger.info("⏱️ [%.1fs] ✅ Stream connected", time.time() - stream_start_time)
-            async for progress in process_stream(stream):
+            logger.info("⏱️ [%.1fs] ✅ Stream connected", _elapsed())
+            async for progress in _coalesce_text_events(process_stream(stream)):
                 yield progress
 
             # If we got here without receiving interaction.start, log it
             if interaction_id is None and received_any_event:
                 logger.warning(
                     "⏱️ [%.1fs] ⚠️ Stream ended but never received interaction.start event",
-                    time.time() - stream_start_time
+                    _elapsed()
                 )
             break
 
@@ -608,16 +824,15 @@ async def deep_research_stream(
                 _record_client_failure()
                 logger.warning(
                     "⏱️ [%.1fs] ⚠️ Stream returned None (TypeError, attempt %d/%d): %s",
-                    time.time() - stream_start_time, initial_attempt, MAX_INITIAL_RETRIES, e
+                    _elapsed(), initial_attempt, MAX_INITIAL_RETRIES, e
                 )
-                backoff = INITIAL_RETRY_BACKOFF ** (initial_attempt - 1)
-                wait_time = min(initial_retry_delay * backoff, MAX_INITIAL_RETRY_DELAY)
+                wait_time = _jittered(_INITIAL_BACKOFF_DELAYS[initial_attempt - 1], RETRY_JITTER)
                 logger.info("   ⏳ Waiting %.1fs before retry...", wait_time)
                 await asyncio.sleep(wait_time)
                 continue
             disconnect_count += 1
             _record_client_failure()
-            elapsed_t = time.time() - stream_start_time
+            elapsed_t = _elapsed()
             logger.warning(
                 "⏱️ [%.1fs] ❌ DISCONNECT #%d (TypeError): %s",
                 elapsed_t, disconnect_count, e
@@ -627,7 +842,7 @@ async def deep_research_stream(
         except Exception as e:
             disconnect_count += 1
             _record_client_failure()
-            elapsed_t = time.time() - stream_start_time
+            elapsed_t = _elapsed()
             error_str = str(e)
             logger.warning(
                 "⏱️ [%.1fs] ❌ DISCONNECT #%d: %s",
@@ -636,8 +851,7 @@ async def deep_research_stream(
 
             # Check if this is a retryable error
             if is_retryable_error(error_str) and initial_attempt < MAX_INITIAL_RETRIES:
-                backoff = INITIAL_RETRY_BACKOFF ** (initial_attempt - 1)
-                wait_time = min(initial_retry_delay * backoff, MAX_INITIAL_RETRY_DELAY)
+                wait_time = _jittered(_INITIAL_BACKOFF_DELAYS[initial_attempt - 1], RETRY_JITTER)
                 logger.info("   🔄 Retryable error, waiting %.1fs before retry...", wait_time)
                 await asyncio.sleep(wait_time)
                 continue
@@ -647,7 +861,7 @@ async def deep_research_stream(
     # Phase 2: Check if we have interaction_id for reconnection
     # ==========================================================================
     if interaction_id is None and not is_complete:
-        elapsed = time.time() - stream_start_time
+        elapsed = _elapsed()
         logger.error(
             "⏱️ [%.1fs] ❌ CRITICAL: No interaction_id received after %d initial attempts. "
             "This may indicate API issues or rate limiting. "
@@ -673,17 +887,15 @@ async def deep_research_stream(
     # ==========================================================================
     while not is_complete and interaction_id and stream_retry_count < MAX_STREAM_RETRIES:
         stream_retry_count += 1
-        elapsed = time.time() - stream_start_time
-        short_id = interaction_id[:16] + "..." if len(interaction_id) > 16 else interaction_id
-        logger.info(
-            "⏱️ [%.1fs] 🔄 RECONNECT attempt %d/%d (id=%s)",
-            elapsed, stream_retry_count, MAX_STREAM_RETRIES, short_id
-        )
-
         # Exponential backoff
-        backoff = STREAM_RETRY_BACKOFF ** (stream_retry_count - 1)
-        wait_time = min(stream_retry_delay * backoff, MAX_STREAM_RETRY_DELAY)
-        logger.info("   ⏳ Waiting %.1fs before reconnect...", wait_time)
+        wait_time = _jittered(_STREAM_BACKOFF_DELAYS[stream_retry_count - 1], RETRY_JITTER)
+        if logger.isEnabledFor(logging.INFO):
+            short_id = interaction_id[:16] + "..." if len(interaction_id) > 16 else interaction_id
+            logger.info(
+                "⏱️ [%.1fs] 🔄 RECONNECT attempt %d/%d (id=%s)",
+                _elapsed(), stream_retry_count, MAX_STREAM_RETRIES, short_id
+            )
+            logger.info("   ⏳ Waiting %.1fs before reconnect...", wait_time)
         await asyncio.sleep(wait_time)
 
         try:
@@ -702,17 +914,17 @@ async def deep_research_stream(
                 _record_client_failure()
                 logger.warning(
                     "⏱️ [%.1fs] ⚠️ Reconnect returned None (attempt %d/%d)",
-                    time.time() - stream_start_time, stream_retry_count, MAX_STREAM_RETRIES
+                    _elapsed(), stream_retry_count, MAX_STREAM_RETRIES
                 )
                 continue
 
             logger.info(
                 "⏱️ [%.1fs] ✅ RECONNECTED successfully",
-                time.time() - stream_start_time
+                _elapsed()
             )
             _record_client_success()
 
-            async for progress in process_stream(resume_stream):
+            async for progress in _coalesce_text_events(process_stream(resume_stream)):
                 yield progress
                 # Reset retry count on successful event
                 stream_retry_count = 0
@@ -720,7 +932,7 @@ async def deep_research_stream(
         except Exception as e:
             disconnect_count += 1
             _record_client_failure()
-            elapsed_t = time.time() - stream_start_time
+            elapsed_t = _elapsed()
             error_str = str(e)
             logger.warning(
                 "⏱️ [%.1fs] ❌ RECONNECT FAILED #%d: %s",
@@ -735,7 +947,7 @@ async def deep_research_stream(
     # Phase 4: Final status check
     # ==========================================================================
     if not is_complete:
-        elapsed = time.time() - stream_start_time
+        elapsed = _elapsed()
         logger.error(
             "⏱️ [%.1fs] ❌ RESEARCH FAILED: disconnects=%d, retries=%d, id=%s",
             elapsed, disconnect_count, stream_retry_count, interaction_id
@@ -769,7 +981,8 @@ async def deep_research(
     and progress updates. The agent autonomously plans, searches, reads,
     and synthesizes information to produce a detailed report.
 
-    Takes 3-20 minutes typically.
+    Takes 3-20 minutes typically. When GEMINI_RESEARCH_CACHE_TTL_SECONDS is set,
+    an identical earlier request is answered from the in-memory response cache.
 
     Args:
         query: Research question or topic
@@ -787,21 +1000,53 @@ async def deep_research(
         DeepResearchError: On timeout, failure, or API errors
     """
     start_time = time.time()
-    text_parts: list[str] = []
+    text_buf = io.StringIO()
     thinking_summaries: list[str] = []
     interaction_id: str | None = None
     raw_interaction: Any = None
 
+    # Classify the callback once; only sync callables need their result probed
+    cb_is_async = on_progress is not None and (
+        inspect.iscoroutinefunction(on_progress)
+        or inspect.iscoroutinefunction(type(on_progress).__call__)
+    )
+
+    async def _emit(progress: DeepResearchProgress) -> None:
+        """Hand a progress event to on_progress, awaiting it if it is async."""
+        if on_progress is None:
+            return
+        cb_result = on_progress(progress)
+        if cb_is_async:
+            await cast(Awaitable[None], cb_result)
+        elif inspect.isawaitable(cb_result):
+            await cb_result
+
+    cache = _get_response_cache()
+    cache_key = ""
+    if cache is not None:
+        cache_key = ResponseCache.make_key(
+            "deep_research",
+            agent_name or get_deep_research_agent(),
+            query,
+            format_instructions,
+            file_search_store_names,
+            resolve_citations,
+        )
+        cached: DeepResearchResult | None = cache.get(cache_key)
+        if cached is not None:
+            logger.info("💾 Deep Research cache hit (id=%s)", cached.interaction_id)
+            await _emit(DeepResearchProgress(
+                event_type="complete", interaction_id=cached.interaction_id
+            ))
+            return _copy_result(cached)
+
     async for progress in deep_research_stream(
         query,
         format_instructions=format_instructions,
         file_search_store_names=file_search_store_names,
         agent_name=agent_name,
     ):
-        if on_progress:
-            cb_result = on_progress(progress)
-            if inspect.isawaitable(cb_result):
-                await cb_result
+        await _emit(progress)
 
         if progress.event_type == "start":
             interaction_id = progress.interaction_id
@@ -810,7 +1055,7 @@ async def deep_research(
                 thinking_summaries.append(progress.content)
         elif progress.event_type == "text":
             if progress.content:
-                text_parts.append(progress.content)
+                text_buf.write(progress.content)
         elif progress.event_type == "error":
             raise DeepResearchError(
                 code="RESEARCH_FAILED",
@@ -818,30 +1063,36 @@ async def deep_research(
                 details={"interaction_id": interaction_id},
             )
 
-    final_text = "".join(text_parts)
+    final_text = text_buf.getvalue()
 
     # Post-stream polling if we got no text but have interaction_id
     if not final_text.strip() and interaction_id:
         logger.info("🔄 POLLING: Stream ended without text...")
         client = _get_healthy_client()  # Use health-monitored client
-        poll_start = time.time()
+        poll_start = time.monotonic()
+        poll_delay = POLL_MIN_INTERVAL
+        last_status: str | None = None
 
-        while time.time() - poll_start < MAX_POLL_TIME:
+        # One monotonic read per poll drives both the budget and the reported elapsed time
+        while (poll_now := time.monotonic()) - poll_start < MAX_POLL_TIME:
             try:
                 final_interaction = await client.aio.interactions.get(id=interaction_id)
                 _record_client_success()  # Keep client alive during polling
                 status = getattr(final_interaction, "status", "unknown")
-
-                if on_progress:
-                    elapsed = time.time() - poll_start
-                    prog = DeepResearchProgress(
+                poll_delay = _next_poll_delay(poll_delay, status_changed=status != last_status)
+                last_status = status
+
+                # Only build the status event when someone is listening
+                status_event: DeepResearchProgress | None = None
+                if on_progress is not None:
+                    elapsed = poll_now - poll_start
+                    status_event = DeepResearchProgress(
                         event_type="status",
                         content=f"Waiting... ({status}, {elapsed:.0f}s)",
                         interaction_id=interaction_id,
                     )
-                    poll_cb_result = on_progress(prog)
-                    if inspect.isawaitable(poll_cb_result):
-                        await poll_cb_result
+                    if status in _TERMINAL_STATUSES:
+                        await _emit(status_event)
 
                 if status == "completed":
                     raw_interaction = final_interaction
@@ -866,7 +1117,12 @@ async def deep_research(
                         details={"interaction_id": interaction_id},
                     )
 
-                await asyncio.sleep(STREAM_POLL_INTERVAL)
+                poll_wait = _jittered(poll_delay, POLL_JITTER)
+                if status_event is not None:
+                    # Let the callback run during the wait instead of before it
+                    await asyncio.gather(_emit(status_event), asyncio.sleep(poll_wait))
+                else:
+                    await asyncio.sleep(poll_wait)
 
             except DeepResearchError:
                 raise
@@ -899,6 +1155,9 @@ async def deep_research(
     if resolve_citations and final_text:
         result = await process_citations(result, resolve_urls=True)
 
+    if cache is not None:
+        cache.set(cache_key, _copy_result(result))
+
     return result
 
 
@@ -943,7 +1202,8 @@ async def research_followup(
 
     This continues the conversation context from a previous research task,
     allowing clarification, summarization, or elaboration on specific sections
-    without restarting the entire research.
+    without restarting the entire research. Repeated questions are served from
+    the response cache when GEMINI_RESEARCH_CACHE_TTL_SECONDS is set.
 
     Args:
         previous_interaction_id: Interaction ID from a completed research task
@@ -959,6 +1219,17 @@ async def research_followup(
     """
     logger.info("💬 Follow-up question for %s: %s", previous_interaction_id, query[:100])
 
+    cache = _get_response_cache()
+    cache_key = ""
+    if cache is not None:
+        cache_key = ResponseCache.make_key(
+            "research_followup", previous_interaction_id, query, model
+        )
+        cached: str | None = cache.get(cache_key)
+        if cached is not None:
+            logger.info("   💾 Follow-up cache hit")
+            return cached
+
     client = _get_healthy_client()  # Use health-monitored client
 
     try:
@@ -986,6 +1257,8 @@ async def research_followup(
             )
 
         logger.info("   ✅ Follow-up response received")
+        if cache is not None:
+            cache.set(cache_key, text)
         return text
 
     except Exception as e:
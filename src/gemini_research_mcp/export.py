@@ -32,11 +32,23 @@ from typing import TYPE_CHECKING, Any
 
 from gemini_research_mcp.config import LOGGER_NAME
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 if TYPE_CHECKING:
     from gemini_research_mcp.storage import ResearchSession
 
 logger = logging.getLogger(LOGGER_NAME)
 
+# Filename / bookmark sanitizers, compiled once at import
+_NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9]")
+_FILENAME_UNSAFE_RE = re.compile(r"[^\w\s-]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class ExportFormat(str, Enum):
     """Supported export formats."""
@@ -71,64 +83,54 @@ class ExportResult:
 # =============================================================================
 
 
-def _format_markdown_export(session: ResearchSession) -> str:
+def _format_markdown_export(session: ResearchSession, exported_at: datetime) -> str:
     """Format a research session as a Markdown document."""
-    lines: list[str] = []
-
-    # Title
     title = session.title or session.query[:60]
-    lines.append(f"# {title}")
-    lines.append("")
-
-    # Metadata block
-    lines.append("## Metadata")
-    lines.append("")
-    lines.append(f"- **Query:** {session.query}")
-    lines.append(f"- **Created:** {session.created_at_iso}")
+
+    # Metadata bullets (optional fields only when set)
+    meta = [
+        f"- **Query:** {session.query}",
+        f"- **Created:** {session.created_at_iso}",
+    ]
     if session.duration_seconds:
         mins = int(session.duration_seconds // 60)
         secs = int(session.duration_seconds % 60)
-        lines.append(f"- **Duration:** {mins}m {secs}s")
+        meta.append(f"- **Duration:** {mins}m {secs}s")
     if session.total_tokens:
-        lines.append(f"- **Tokens:** {session.total_tokens:,}")
+        meta.append(f"- **Tokens:** {session.total_tokens:,}")
     if session.agent_name:
-        lines.append(f"- **Agent:** {session.agent_name}")
+        meta.append(f"- **Agent:** {session.agent_name}")
     if session.tags:
-        lines.append(f"- **Tags:** {', '.join(session.tags)}")
+        meta.append(f"- **Tags:** {', '.join(session.tags)}")
     if session.notes:
-        lines.append(f"- **Notes:** {session.notes}")
-    lines.append(f"- **Interaction ID:** `{session.interaction_id}`")
+        meta.append(f"- **Notes:** {session.notes}")
+    meta.append(f"- **Interaction ID:** `{session.interaction_id}`")
     if session.expires_at_iso:
-        lines.append(f"- **Expires:** {session.expires_at_iso}")
-    lines.append("")
+        meta.append(f"- **Expires:** {session.expires_at_iso}")
+    meta_block = "\n".join(meta)
 
-    # Summary
-    if session.summary:
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(session.summary)
-        lines.append("")
+    summary_block = f"## Summary\n\n{session.summary}\n\n" if session.summary else ""
+    report_block = (
+        f"## Research Report\n\n{session.report_text}\n\n" if session.report_text else ""
+    )
+    exported = exported_at.strftime("%Y-%m-%d %H:%M:%S UTC")
 
-    # Full report
-    if session.report_text:
-        lines.append("## Research Report")
-        lines.append("")
-        lines.append(session.report_text)
-        lines.append("")
-
-    # Footer
-    lines.append("---")
-    lines.append(
-        f"*Exported from Gemini Research MCP on "
-        f"{datetime.now(tz=UTC).strftime('%Y-%m-%d %H:%M:%S UTC')}*"
+    # The report is copied once into the final string
+    return (
+        f"# {title}\n\n## Metadata\n\n{meta_block}\n\n"
+        f"{summary_block}{report_block}"
+        f"---\n*Exported from Gemini Research MCP on {exported}*"
     )
 
-    return "\n".join(lines)
 
+def export_to_markdown(
+    session: ResearchSession, *, exported_at: datetime | None = None
+) -> ExportResult:
+    """Export a research session to Markdown format.
 
-def export_to_markdown(session: ResearchSession) -> ExportResult:
-    """Export a research session to Markdown format."""
-    content = _format_markdown_export(session)
+    ``exported_at`` lets batch exports stamp every file with one timestamp.
+    """
+    content = _format_markdown_export(session, exported_at or datetime.now(tz=UTC))
     filename = _generate_filename(session, "md")
 
     return ExportResult(
@@ -144,7 +146,7 @@ def export_to_markdown(session: ResearchSession) -> ExportResult:
 # =============================================================================
 
 
-def _session_to_export_dict(session: ResearchSession) -> dict[str, Any]:
+def _session_to_export_dict(session: ResearchSession, exported_at: datetime) -> dict[str, Any]:
     """Convert session to export-friendly dictionary."""
     return {
         "interaction_id": session.interaction_id,
@@ -160,20 +162,29 @@ def _session_to_export_dict(session: ResearchSession) -> dict[str, Any]:
         "notes": session.notes,
         "created_at": session.created_at_iso,
         "expires_at": session.expires_at_iso,
-        "export_timestamp": datetime.now(tz=UTC).isoformat(),
+        "export_timestamp": exported_at.isoformat(),
     }
 
 
-def export_to_json(session: ResearchSession) -> ExportResult:
-    """Export a research session to JSON format."""
-    data = _session_to_export_dict(session)
-    content = json.dumps(data, indent=2, ensure_ascii=False)
+def export_to_json(
+    session: ResearchSession, *, exported_at: datetime | None = None
+) -> ExportResult:
+    """Export a research session to JSON format.
+
+    ``exported_at`` lets batch exports stamp every file with one timestamp.
+    """
+    data = _session_to_export_dict(session, exported_at or datetime.now(tz=UTC))
+    # orjson (optional) writes UTF-8 bytes directly; same layout as indent=2
+    if _HAS_ORJSON:
+        content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        content = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
     filename = _generate_filename(session, "json")
 
     return ExportResult(
         format=ExportFormat.JSON,
         filename=filename,
-        content=content.encode("utf-8"),
+        content=content,
         mime_type="application/json",
     )
 
@@ -346,10 +357,8 @@ def _create_bookmark_id(title: str, index: int) -> str:
     We use a simple index-based approach for reliability, with a short
     prefix from the title for human readability when debugging.
     """
-    import re
-
     # Extract just alphanumeric characters, take first 15 chars
-    safe = re.sub(r"[^a-zA-Z0-9]", "", title)
+    safe = _NON_ALNUM_RE.sub("", title)
     safe = safe[:15] if safe else "heading"
 
     # Ensure it starts with a letter
@@ -1200,6 +1209,7 @@ def export_to_docx(
     include_toc: bool = True,
     include_cover_page: bool = True,
     toc_levels: int = 3,  # noqa: ARG001 - kept for API compatibility
+    exported_at: datetime | None = None,
 ) -> ExportResult:
     """
     Export a research session to DOCX format using Marko + python-docx.
@@ -1218,6 +1228,7 @@ def export_to_docx(
         include_toc: Whether to include a Table of Contents (default: True)
         include_cover_page: Whether to include a cover page (default: True)
         toc_levels: Number of heading levels in TOC (kept for API compat)
+        exported_at: Timestamp for the footer (default: now)
 
     Requires marko and python-docx packages.
     Install with: pip install 'gemini-research-mcp[docx]'
@@ -1319,7 +1330,7 @@ def export_to_docx(
     footer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
     gen_run = footer_para.add_run(
         f"Generated by Gemini Research MCP • "
-        f"{datetime.now(tz=UTC).strftime('%Y-%m-%d %H:%M UTC')}"
+        f"{(exported_at or datetime.now(tz=UTC)).strftime('%Y-%m-%d %H:%M UTC')}"
     )
     gen_run.font.name = "Calibri"
     gen_run.italic = True
@@ -1373,8 +1384,8 @@ def _generate_filename(session: ResearchSession, extension: str) -> str:
     base = _extract_clean_title(session.query, session.title)
 
     # Clean up for filename
-    safe = re.sub(r"[^\w\s-]", "", base)  # Remove special chars
-    safe = re.sub(r"\s+", "_", safe)  # Replace spaces with underscores
+    safe = _FILENAME_UNSAFE_RE.sub("", base)  # Remove special chars
+    safe = _WHITESPACE_RE.sub("_", safe)  # Replace spaces with underscores
     safe = safe[:50]  # Limit length
 
     # Add timestamp
@@ -1387,6 +1398,8 @@ def export_session(
     session: ResearchSession,
     format: ExportFormat | str,
     output_path: Path | str | None = None,
+    *,
+    exported_at: datetime | None = None,
 ) -> ExportResult:
     """
     Export a research session to the specified format.
@@ -1395,6 +1408,8 @@ def export_session(
         session: The research session to export
         format: Export format (markdown, json, docx)
         output_path: Optional path to save the file (if None, returns bytes only)
+        exported_at: Export timestamp to embed (default: now); pass one value
+            when exporting many sessions so they share a single stamp
 
     Returns:
         ExportResult with format, filename, content bytes, and mime_type
@@ -1415,11 +1430,11 @@ def export_session(
 
     # Export
     if export_format == ExportFormat.MARKDOWN:
-        result = export_to_markdown(session)
+        result = export_to_markdown(session, exported_at=exported_at)
     elif export_format == ExportFormat.JSON:
-        result = export_to_json(session)
+        result = export_to_json(session, exported_at=exported_at)
     elif export_format == ExportFormat.DOCX:
-        result = export_to_docx(session)
+        result = export_to_docx(session, exported_at=exported_at)
     else:
         raise ValueError(f"Unsupported format: {export_format}")
 
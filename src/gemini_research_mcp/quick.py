@@ -6,6 +6,7 @@ Provides fast web research with citations in 5-30 seconds.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from typing import TYPE_CHECKING
@@ -35,6 +36,50 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(LOGGER_NAME)
 
+# Shared client: quick research, summaries and clarification reuse one connection
+# pool instead of paying a fresh TLS handshake per call. The async pool belongs
+# to the event loop that opened it, so the client is keyed on (api_key, loop).
+_client: genai.Client | None = None
+_client_key: tuple[str, asyncio.AbstractEventLoop] | None = None
+# Close tasks for replaced clients, held so they are not garbage-collected early
+_closing: set[asyncio.Task[None]] = set()
+
+
+def get_client() -> genai.Client:
+    """Get the shared Gemini client for the running loop.
+
+    The client is rebuilt when the API key or the event loop changes. A
+    replaced client on the same loop has its connections closed in the
+    background; one from another loop is dropped, since its pool cannot be
+    closed from here.
+    """
+    global _client, _client_key
+
+    key = (get_api_key(), asyncio.get_running_loop())
+    if _client is None or key != _client_key:
+        old_client, old_key = _client, _client_key
+        _client = genai.Client(api_key=key[0])
+        _client_key = key
+        if old_client is not None and old_key is not None and old_key[1] is key[1]:
+            task = key[1].create_task(old_client.aio.aclose())
+            _closing.add(task)
+            task.add_done_callback(_closing.discard)
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared Gemini client's connections (call on shutdown)."""
+    global _client, _client_key
+
+    client, key = _client, _client_key
+    _client, _client_key = None, None
+    # Finish closing replaced clients first, so clients close oldest first
+    if _closing:
+        await asyncio.gather(*_closing, return_exceptions=True)
+    if client is not None and key is not None and key[1] is asyncio.get_running_loop():
+        await client.aio.aclose()
+
+
 # Map string levels to ThinkingLevel enum
 THINKING_LEVEL_MAP = {
     "minimal": ThinkingLevel.MINIMAL,
@@ -94,15 +139,11 @@ def _extract_sources(response: GenerateContentResponse) -> tuple[list[Source], l
         queries = list(gm.web_search_queries)
 
     # Extract sources from grounding chunks
-    if gm.grounding_chunks:
-        for chunk in gm.grounding_chunks:
-            if hasattr(chunk, "web") and chunk.web:
-                sources.append(
-                    Source(
-                        uri=chunk.web.uri or "",
-                        title=chunk.web.title or "",
-                    )
-                )
+    sources = [
+        Source(uri=web.uri or "", title=web.title or "")
+        for chunk in gm.grounding_chunks or ()
+        if (web := getattr(chunk, "web", None))
+    ]
 
     if not sources and response.text:
         sources = _extract_sources_from_text(response.text)
@@ -135,7 +176,7 @@ async def quick_research(
     Returns:
         ResearchResult with text, sources, queries, and optional thinking summary
     """
-    client = genai.Client(api_key=get_api_key())
+    client = get_client()
     model = model or get_model()
 
     if thinking_level and thinking_level.lower() != "high":
@@ -216,7 +257,7 @@ async def generate_session_metadata(
     if not text:
         return SessionMetadata(title="", summary="")
 
-    client = genai.Client(api_key=get_api_key())
+    client = get_client()
     model = get_summary_model()
 
     # Truncate input to first ~2000 chars to minimize tokens
@@ -299,7 +340,7 @@ async def generate_title_from_query(
     if not query:
         return ""
 
-    client = genai.Client(api_key=get_api_key())
+    client = get_client()
     model = get_summary_model()
 
     # Truncate query if very long
@@ -365,7 +406,7 @@ async def semantic_match_session(
         # Only one session - return it directly
         return sessions[0]["id"]
 
-    client = genai.Client(api_key=get_api_key())
+    client = get_client()
     model = get_summary_model()
 
     # Build session list for prompt (truncate summaries to avoid context overflow)
@@ -52,6 +52,7 @@ from gemini_research_mcp.config import (
     get_export_dir,
     get_model,
 )
+from gemini_research_mcp.content import close_fetch_clients
 from gemini_research_mcp.content import fetch_webpage as _fetch_webpage
 from gemini_research_mcp.deep import (
     deep_research_stream,
@@ -68,6 +69,7 @@ from gemini_research_mcp.export import (
     ExportResult,
     export_session,
 )
+from gemini_research_mcp.quick import close_client as close_quick_client
 from gemini_research_mcp.quick import (
     generate_session_metadata,
     generate_title_from_query,
@@ -154,7 +156,7 @@ def _get_cached_export(export_id: str) -> ExportCacheEntry | None:
 
 @asynccontextmanager
 async def lifespan(app: FastMCP) -> AsyncIterator[None]:
-    """Check for resumable sessions on startup.
+    """Check for resumable sessions on startup and close pooled HTTP clients on shutdown.
 
     Task support is handled entirely by FastMCP's built-in Docket system:
     - _docket_lifespan() auto-detects TaskConfig-enabled tools
@@ -174,7 +176,11 @@ async def lifespan(app: FastMCP) -> AsyncIterator[None]:
     except Exception as e:
         logger.warning("Failed to check for resumable sessions: %s", e)
 
-    yield
+    try:
+        yield
+    finally:
+        await close_fetch_clients()
+        await close_quick_client()
 
 
 # =============================================================================
@@ -20,6 +20,7 @@ from gemini_research_mcp.config import (
     get_api_key,
     get_deep_research_agent,
     get_model,
+    get_response_cache_ttl,
     is_retryable_error,
 )
 from gemini_research_mcp.types import DeepResearchAgent
@@ -122,6 +123,28 @@ class TestGetDeepResearchAgent:
             get_deep_research_agent()
 
 
+class TestGetResponseCacheTtl:
+    """Test get_response_cache_ttl function."""
+
+    def test_disabled_by_default(self):
+        """Cache should be off when the env var is unset."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert get_response_cache_ttl() == 0.0
+
+    def test_env_override(self):
+        """Env var should set the TTL in seconds."""
+        with patch.dict(os.environ, {"GEMINI_RESEARCH_CACHE_TTL_SECONDS": "3600"}):
+            assert get_response_cache_ttl() == 3600.0
+
+    def test_rejects_invalid_value(self):
+        """Non-numeric values should fail fast."""
+        with (
+            patch.dict(os.environ, {"GEMINI_RESEARCH_CACHE_TTL_SECONDS": "a day"}),
+            pytest.raises(ValueError, match="GEMINI_RESEARCH_CACHE_TTL_SECONDS"),
+        ):
+            get_response_cache_ttl()
+
+
 class TestIsRetryableError:
     """Test is_retryable_error function."""
 
@@ -146,6 +169,11 @@ class TestIsRetryableError:
         assert is_retryable_error("Gateway_Timeout")
         assert is_retryable_error("CONNECTION_RESET")
 
+    def test_every_listed_error_detected(self):
+        """Each RETRYABLE_ERRORS entry should match when embedded in a message."""
+        for err in RETRYABLE_ERRORS:
+            assert is_retryable_error(f"upstream failed: {err.upper()} (code 14)")
+
 
 class TestDefaultSystemPrompt:
     """Test default_system_prompt function."""
@@ -177,3 +205,18 @@ class TestDefaultSystemPrompt:
         """Prompt should mention structuring answers."""
         prompt = default_system_prompt()
         assert "structure" in prompt.lower() or "heading" in prompt.lower()
+
+    def test_tracks_date_change(self):
+        """Cached prompt should be re-rendered when the day rolls over."""
+
+        class FakeDate(date):
+            current = date(2026, 1, 31)
+
+            @classmethod
+            def today(cls) -> date:
+                return cls.current
+
+        with patch("gemini_research_mcp.config.date", FakeDate):
+            assert "January 31, 2026" in default_system_prompt()
+            FakeDate.current = date(2026, 2, 1)
+            assert "February 01, 2026" in default_system_prompt()
@@ -4,6 +4,8 @@ Unit tests for content.py - SSRF protection and content extraction.
 These tests run without network access using mocks where needed.
 """
 
+from collections.abc import AsyncIterator
+
 import httpx
 import pytest
 
@@ -12,8 +14,11 @@ from gemini_research_mcp.content import (
     _slice_content,
     check_robots_txt,
     is_private_ip,
+    is_private_ip_async,
     validate_proxy_url,
+    validate_proxy_url_async,
     validate_url,
+    validate_url_async,
 )
 
 
@@ -71,6 +76,119 @@ class TestSSRFProtection:
         assert is_private_ip("1.1.1.1") is False
 
 
+class TestResolvedAddressClassification:
+    """Tests for classifying getaddrinfo results."""
+
+    def test_reserved_and_mapped_addresses_blocked(self):
+        """Ranges outside the textual prefixes must still be caught after resolution."""
+        from gemini_research_mcp.content import _resolves_to_private
+
+        def addrinfo(*ips: str) -> list[tuple[object, ...]]:
+            return [(0, 0, 0, "", (ip, 0)) for ip in ips]
+
+        assert _resolves_to_private(addrinfo("93.184.216.34", "0.0.0.0")) is True
+        assert _resolves_to_private(addrinfo("::ffff:127.0.0.1")) is True
+        assert _resolves_to_private(addrinfo("240.0.0.1")) is True
+        assert _resolves_to_private(addrinfo("8.8.8.8", "8.8.8.8", "64:ff9b::808:808")) is False
+
+
+class TestSSRFProtectionAsync:
+    """Tests for the non-blocking SSRF checks."""
+
+    @pytest.mark.asyncio
+    async def test_blocklists_checked_without_dns(self):
+        """Static blocklists should short-circuit before any resolution."""
+        assert await is_private_ip_async("LOCALHOST") is True
+        assert await is_private_ip_async("10.0.0.1") is True
+        assert await is_private_ip_async("fe80::1") is True
+
+    @pytest.mark.asyncio
+    async def test_public_ips_allowed(self):
+        """Public literal IPs should be allowed."""
+        assert await is_private_ip_async("8.8.8.8") is False
+
+    @pytest.mark.asyncio
+    async def test_cached_verdict_reused(self, monkeypatch: pytest.MonkeyPatch):
+        """A fresh cache entry should be returned without resolving again."""
+        import time
+
+        import gemini_research_mcp.content as content
+
+        monkeypatch.setattr(
+            content, "_dns_cache", {"internal.example": (time.monotonic() + 60, True)}
+        )
+
+        assert await is_private_ip_async("Internal.Example") is True
+        ok, error = await validate_url_async("https://internal.example/x")
+        assert ok is False
+        assert "SSRF blocked" in error
+
+    def test_sync_check_shares_cache(self, monkeypatch: pytest.MonkeyPatch):
+        """The sync validator should honour verdicts cached by either variant."""
+        import time
+
+        import gemini_research_mcp.content as content
+
+        monkeypatch.setattr(
+            content, "_dns_cache", {"internal.example": (time.monotonic() + 60, True)}
+        )
+
+        ok, error = validate_url("https://internal.example/a")
+        assert ok is False
+        assert "SSRF blocked" in error
+
+    @pytest.mark.asyncio
+    async def test_public_verdict_not_cached(self, monkeypatch: pytest.MonkeyPatch):
+        """A public answer must be re-resolved each time (DNS rebinding)."""
+        import asyncio
+        import socket
+
+        import gemini_research_mcp.content as content
+
+        answers = iter(["93.184.216.34", "127.0.0.1"])
+
+        async def fake_getaddrinfo(host, port, **kwargs):
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (next(answers), 0))]
+
+        monkeypatch.setattr(content, "_dns_cache", {})
+        monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", fake_getaddrinfo)
+
+        assert await is_private_ip_async("rebind.example") is False
+        assert content._dns_cache == {}
+        assert await is_private_ip_async("rebind.example") is True
+        assert "rebind.example" in content._dns_cache
+
+    def test_dns_cache_bounded(self, monkeypatch: pytest.MonkeyPatch):
+        """Blocked verdicts should be evicted once the cache is full."""
+        import gemini_research_mcp.content as content
+
+        monkeypatch.setattr(content, "_dns_cache", {})
+        monkeypatch.setattr(content, "DNS_CACHE_MAX_ENTRIES", 3)
+
+        content._store_verdict("expired.example", True, 0.0)
+        content._store_verdict("old.example", True, 1000.0)
+        content._store_verdict("mid.example", True, 1000.0)
+        content._store_verdict("new.example", True, content.DNS_CACHE_TTL + 1.0)
+        content._store_verdict("newest.example", True, content.DNS_CACHE_TTL + 1.0)
+
+        assert list(content._dns_cache) == ["mid.example", "new.example", "newest.example"]
+
+    @pytest.mark.asyncio
+    async def test_validate_proxy_url_async(self):
+        """The async proxy check should match the sync validator."""
+        assert await validate_proxy_url_async("https://example.com:3128") == (True, "")
+        ok, err = await validate_proxy_url_async("http://127.0.0.1:3128")
+        assert ok is False
+        assert err == validate_proxy_url("http://127.0.0.1:3128")[1]
+
+    @pytest.mark.asyncio
+    async def test_validate_url_async_rejects_bad_scheme(self):
+        """Scheme checks should match the sync validator."""
+        ok, error = await validate_url_async("file:///etc/passwd")
+        assert ok is False
+        assert error == validate_url("file:///etc/passwd")[1]
+
+
 class TestURLValidation:
     """Tests for URL validation."""
 
@@ -166,6 +284,14 @@ class TestFetchResult:
         assert result.is_truncated is False
         assert result.total_content_length == 0
 
+    def test_result_is_immutable(self):
+        """FetchResult is frozen, so fields cannot be reassigned."""
+        import dataclasses
+
+        result = FetchResult(url="https://example.com", title=None, content="", word_count=0)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.error = "changed"  # type: ignore[misc]
+
 
 class TestChunking:
     """Tests for chunk slicing helper."""
@@ -195,6 +321,45 @@ class TestChunking:
         assert total_len == 3
 
 
+class TestLexborExtraction:
+    """Tests for the selectolax fallback extractor."""
+
+    def test_skips_boilerplate_and_breaks_blocks(self):
+        """Script/nav content is dropped and block elements end a line."""
+        pytest.importorskip("selectolax")
+        from gemini_research_mcp.content import _extract_text_lexbor
+
+        html = (
+            "<html><head><title> Page </title><style>x{}</style></head><body>"
+            "<nav>menu</nav><h1>Head</h1>\n\n\n<p>Hello   <b>world</b></p>"
+            "<ul><li>a</li><li>b</li></ul><script>s()</script></body></html>"
+        )
+        result = _extract_text_lexbor(html)
+
+        assert result is not None
+        title, content = result
+        assert title == "Page"
+        assert content == "Head\n\nHello world\na\nb"
+
+
+class TestTextExtractor:
+    """Tests for the html.parser last-resort extractor."""
+
+    def test_collapses_blank_runs_and_skips_boilerplate(self):
+        """Runs of block breaks collapse to one blank line; skipped tags emit nothing."""
+        from gemini_research_mcp.content import _MULTI_NL, _TextExtractor
+
+        parser = _TextExtractor()
+        parser.feed(
+            "<title>Page</title><script>x()</script>"
+            "<div><div><div><p>One</p></div></div></div><p>Two</p>"
+        )
+        content = _MULTI_NL.sub("\n\n", "".join(parser.text_parts).strip())
+
+        assert parser.title == "Page"
+        assert content == "One \n\nTwo"
+
+
 class TestRobotsCache:
     """Tests for robots cache behavior."""
 
@@ -293,7 +458,10 @@ class TestFetchWebpageAsync:
         async def fake_robots(*args: object, **kwargs: object) -> bool:
             return False
 
-        monkeypatch.setattr(content, "validate_url", lambda _: (True, ""))
+        async def always_valid(url: str) -> tuple[bool, str]:
+            return True, ""
+
+        monkeypatch.setattr(content, "validate_url_async", always_valid)
         monkeypatch.setattr(content, "check_robots_txt", fake_robots)
 
         result = await content.fetch_webpage("https://example.com")
@@ -315,6 +483,14 @@ class TestFetchWebpageAsync:
             def raise_for_status(self) -> None:
                 return None
 
+            encoding = "utf-8"
+
+            async def aiter_bytes(self, chunk_size: int | None = None) -> AsyncIterator[bytes]:
+                yield self.text.encode()
+
+            async def aclose(self) -> None:
+                return None
+
         class MockClient:
             def __init__(self, *args: object, **kwargs: object) -> None:
                 captured_proxy["value"] = kwargs.get("proxy")  # type: ignore[assignment]
@@ -325,21 +501,34 @@ class TestFetchWebpageAsync:
             async def __aexit__(self, exc_type: object, exc: object, tb: object) -> None:
                 return None
 
+            def build_request(self, method: str, url: str) -> str:
+                return url
+
+            async def send(self, request: str, *, stream: bool = False) -> MockResponse:
+                return await self.get(request)
+
             async def get(self, url: str) -> MockResponse:
                 return MockResponse()
 
         async def always_true(*args: object, **kwargs: object) -> bool:
             return True
 
-        monkeypatch.setattr(content, "validate_url", lambda _: (True, ""))
+        async def always_valid(url: str) -> tuple[bool, str]:
+            return True, ""
+
+        monkeypatch.setattr(content, "validate_url_async", always_valid)
         monkeypatch.setattr(content, "check_robots_txt", always_true)
         monkeypatch.setattr(httpx, "AsyncClient", MockClient)
+        monkeypatch.setattr(content, "_fetch_client", None)
+        monkeypatch.delenv("FETCH_PROXY_URL", raising=False)
 
         proxy = "http://proxy.example.com:3128"
         result = await content.fetch_webpage("https://example.com", proxy_url=proxy)
 
         assert result.error is None
         assert captured_proxy["value"] == proxy
+        # Caller-supplied proxies get a per-call client, never the shared pool
+        assert content._fetch_client is None
 
     @pytest.mark.asyncio
     async def test_proxy_url_env_fallback(self, monkeypatch: pytest.MonkeyPatch):
@@ -357,6 +546,14 @@ class TestFetchWebpageAsync:
             def raise_for_status(self) -> None:
                 return None
 
+            encoding = "utf-8"
+
+            async def aiter_bytes(self, chunk_size: int | None = None) -> AsyncIterator[bytes]:
+                yield self.text.encode()
+
+            async def aclose(self) -> None:
+                return None
+
         class MockClient:
             def __init__(self, *args: object, **kwargs: object) -> None:
                 captured_proxy["value"] = kwargs.get("proxy")  # type: ignore[assignment]
@@ -367,15 +564,25 @@ class TestFetchWebpageAsync:
             async def __aexit__(self, exc_type: object, exc: object, tb: object) -> None:
                 return None
 
+            def build_request(self, method: str, url: str) -> str:
+                return url
+
+            async def send(self, request: str, *, stream: bool = False) -> MockResponse:
+                return await self.get(request)
+
             async def get(self, url: str) -> MockResponse:
                 return MockResponse()
 
         async def always_true(*args: object, **kwargs: object) -> bool:
             return True
 
-        monkeypatch.setattr(content, "validate_url", lambda _: (True, ""))
+        async def always_valid(url: str) -> tuple[bool, str]:
+            return True, ""
+
+        monkeypatch.setattr(content, "validate_url_async", always_valid)
         monkeypatch.setattr(content, "check_robots_txt", always_true)
         monkeypatch.setattr(httpx, "AsyncClient", MockClient)
+        monkeypatch.setattr(content, "_fetch_client", None)
         monkeypatch.setenv("FETCH_PROXY_URL", "http://proxy.example.com:3128")
 
         result = await content.fetch_webpage("https://example.com")
@@ -408,6 +615,14 @@ class TestFetchWebpageAsync:
             def raise_for_status(self) -> None:
                 return None
 
+            encoding = "utf-8"
+
+            async def aiter_bytes(self, chunk_size: int | None = None) -> AsyncIterator[bytes]:
+                yield self.text.encode()
+
+            async def aclose(self) -> None:
+                return None
+
         class MockClient:
             def __init__(self, *args: object, **kwargs: object) -> None:
                 pass
@@ -418,6 +633,12 @@ class TestFetchWebpageAsync:
             async def __aexit__(self, exc_type: object, exc: object, tb: object) -> None:
                 return None
 
+            def build_request(self, method: str, url: str) -> str:
+                return url
+
+            async def send(self, request: str, *, stream: bool = False) -> MockResponse:
+                return await self.get(request)
+
             async def get(self, url: str) -> MockResponse:
                 requests.append(url)
                 if url == "https://example.com/start":
@@ -436,6 +657,7 @@ class TestFetchWebpageAsync:
 
         monkeypatch.setattr(content, "check_robots_txt", always_true)
         monkeypatch.setattr(httpx, "AsyncClient", MockClient)
+        monkeypatch.setattr(content, "_fetch_client", None)
 
         result = await content.fetch_webpage("https://example.com/start")
 
@@ -461,6 +683,14 @@ class TestFetchWebpageAsync:
             def raise_for_status(self) -> None:
                 return None
 
+            encoding = "utf-8"
+
+            async def aiter_bytes(self, chunk_size: int | None = None) -> AsyncIterator[bytes]:
+                yield self.text.encode()
+
+            async def aclose(self) -> None:
+                return None
+
         class MockClient:
             def __init__(self, *args: object, **kwargs: object) -> None:
                 pass
@@ -471,6 +701,12 @@ class TestFetchWebpageAsync:
             async def __aexit__(self, exc_type: object, exc: object, tb: object) -> None:
                 return None
 
+            def build_request(self, method: str, url: str) -> str:
+                return url
+
+            async def send(self, request: str, *, stream: bool = False) -> MockResponse:
+                return await self.get(request)
+
             async def get(self, url: str) -> MockResponse:
                 requests.append(url)
                 return MockResponse(302, url, headers={"location": "http://127.0.0.1/admin"})
@@ -478,19 +714,167 @@ class TestFetchWebpageAsync:
         async def always_true(*args: object, **kwargs: object) -> bool:
             return True
 
-        def fake_validate_url(url: str) -> tuple[bool, str]:
+        async def fake_validate_url(url: str) -> tuple[bool, str]:
             if url == "https://example.com":
                 return True, ""
             if url == "http://127.0.0.1/admin":
                 return False, "SSRF blocked: 127.0.0.1 resolves to private/internal address"
             return True, ""
 
-        monkeypatch.setattr(content, "validate_url", fake_validate_url)
+        monkeypatch.setattr(content, "validate_url_async", fake_validate_url)
         monkeypatch.setattr(content, "check_robots_txt", always_true)
         monkeypatch.setattr(httpx, "AsyncClient", MockClient)
+        monkeypatch.setattr(content, "_fetch_client", None)
 
         result = await content.fetch_webpage("https://example.com")
 
         assert result.error is not None
         assert "Unsafe redirect blocked" in result.error
         assert requests == ["https://example.com"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_client_reused_across_calls(self, monkeypatch: pytest.MonkeyPatch):
+        """Repeated fetches should share one pooled client per proxy until closed."""
+        import gemini_research_mcp.content as content
+
+        created: list[object] = []
+        closed: list[object] = []
+
+        class MockResponse:
+            status_code = 200
+            headers: dict[str, str] = {}
+            text = "<html><head><title>T</title></head><body><p>Hello world.</p></body></html>"
+            url = httpx.URL("https://example.com")
+
+            def raise_for_status(self) -> None:
+                return None
+
+            encoding = "utf-8"
+
+            async def aiter_bytes(self, chunk_size: int | None = None) -> AsyncIterator[bytes]:
+                yield self.text.encode()
+
+            async def aclose(self) -> None:
+                return None
+
+        class MockClient:
+            def __init__(self, *args: object, **kwargs: object) -> None:
+                created.append(self)
+
+            def build_request(self, method: str, url: str) -> str:
+                return url
+
+            async def send(self, request: str, *, stream: bool = False) -> MockResponse:
+                return await self.get(request)
+
+            async def get(self, url: str) -> MockResponse:
+                return MockResponse()
+
+            async def aclose(self) -> None:
+                closed.append(self)
+
+        async def always_true(*args: object, **kwargs: object) -> bool:
+            return True
+
+        async def always_valid(url: str) -> tuple[bool, str]:
+            return True, ""
+
+        monkeypatch.setattr(content, "validate_url_async", always_valid)
+        monkeypatch.setattr(content, "check_robots_txt", always_true)
+        monkeypatch.setattr(httpx, "AsyncClient", MockClient)
+        monkeypatch.setattr(content, "_fetch_client", None)
+        monkeypatch.delenv("FETCH_PROXY_URL", raising=False)
+
+        await content.fetch_webpage("https://example.com/a")
+        await content.fetch_webpage("https://example.com/b")
+        assert len(created) == 1
+
+        await content.close_fetch_clients()
+        assert closed == created
+        assert content._fetch_client is None
+
+    def test_fetch_client_bound_to_event_loop(self, monkeypatch: pytest.MonkeyPatch):
+        """A new event loop should get its own pooled client."""
+        import asyncio
+
+        import gemini_research_mcp.content as content
+
+        created: list[object] = []
+
+        class MockClient:
+            def __init__(self, *args: object, **kwargs: object) -> None:
+                created.append(self)
+
+            async def aclose(self) -> None:
+                return None
+
+        monkeypatch.setattr(httpx, "AsyncClient", MockClient)
+        monkeypatch.setattr(content, "_fetch_client", None)
+        monkeypatch.setattr(content, "_fetch_client_key", None)
+
+        async def get_twice() -> object:
+            first = await content._get_fetch_client(None)
+            assert await content._get_fetch_client(None) is first
+            return first
+
+        first = asyncio.run(get_twice())
+        second = asyncio.run(get_twice())
+
+        assert first is not second
+        assert created == [first, second]
+
+    @pytest.mark.asyncio
+    async def test_streamed_body_capped_without_content_length(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Bodies larger than the cap should be rejected even without Content-Length."""
+        import gemini_research_mcp.content as content
+
+        chunks_read: list[int] = []
+
+        class MockResponse:
+            status_code = 200
+            headers: dict[str, str] = {}
+            url = httpx.URL("https://example.com")
+            encoding = "utf-8"
+
+            def raise_for_status(self) -> None:
+                return None
+
+            async def aiter_bytes(self, chunk_size: int | None = None) -> AsyncIterator[bytes]:
+                for i in range(100):
+                    chunks_read.append(i)
+                    yield b"x" * 64
+
+            async def aclose(self) -> None:
+                return None
+
+        class MockClient:
+            def __init__(self, *args: object, **kwargs: object) -> None:
+                pass
+
+            def build_request(self, method: str, url: str) -> str:
+                return url
+
+            async def send(self, request: str, *, stream: bool = False) -> MockResponse:
+                return MockResponse()
+
+        async def always_true(*args: object, **kwargs: object) -> bool:
+            return True
+
+        async def always_valid(url: str) -> tuple[bool, str]:
+            return True, ""
+
+        monkeypatch.setattr(content, "validate_url_async", always_valid)
+        monkeypatch.setattr(content, "check_robots_txt", always_true)
+        monkeypatch.setattr(content, "MAX_RESPONSE_SIZE", 256)
+        monkeypatch.setattr(httpx, "AsyncClient", MockClient)
+        monkeypatch.setattr(content, "_fetch_client", None)
+
+        result = await content.fetch_webpage("https://example.com")
+
+        assert result.error is not None
+        assert "Content too large" in result.error
+        assert f"exceeded {256 / 1024 / 1024:g}MB" in result.error
+        # Reading stops as soon as the cap is crossed
+        assert len(chunks_read) == 5
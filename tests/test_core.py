@@ -81,6 +81,7 @@ class TestThinkingLevel:
             )
         )
 
+        monkeypatch.setattr("gemini_research_mcp.quick._client", None)
         monkeypatch.setattr("gemini_research_mcp.quick.get_api_key", lambda: "test-key")
         monkeypatch.setattr("gemini_research_mcp.quick.get_model", lambda: "gemini-3.1-pro-preview")
         monkeypatch.setattr(
@@ -98,6 +99,58 @@ class TestThinkingLevel:
         assert DEFAULT_THINKING_LEVEL == "high"
 
 
+class TestSharedClient:
+    """Test the shared Gemini client in quick.py."""
+
+    def _fake_client_factory(self, closed: list[str]):
+        def make_client(api_key: str) -> types.SimpleNamespace:
+            async def aclose() -> None:
+                closed.append(api_key)
+
+            return types.SimpleNamespace(api_key=api_key, aio=types.SimpleNamespace(aclose=aclose))
+
+        return make_client
+
+    @pytest.mark.asyncio
+    async def test_api_key_change_closes_old_client(self, monkeypatch):
+        """Replacing the client for a new API key should close the old one."""
+        from gemini_research_mcp import quick
+
+        closed: list[str] = []
+        api_key = ["key-1"]
+        monkeypatch.setattr(quick, "_client", None)
+        monkeypatch.setattr(quick, "_client_key", None)
+        monkeypatch.setattr(quick, "get_api_key", lambda: api_key[0])
+        monkeypatch.setattr(quick.genai, "Client", self._fake_client_factory(closed))
+
+        first = quick.get_client()
+        assert quick.get_client() is first
+
+        api_key[0] = "key-2"
+        second = quick.get_client()
+        assert second is not first
+
+        await quick.close_client()
+        assert closed == ["key-1", "key-2"]
+
+    def test_new_event_loop_gets_new_client(self, monkeypatch):
+        """Each event loop should get its own client."""
+        import asyncio
+
+        from gemini_research_mcp import quick
+
+        closed: list[str] = []
+        monkeypatch.setattr(quick, "_client", None)
+        monkeypatch.setattr(quick, "_client_key", None)
+        monkeypatch.setattr(quick, "get_api_key", lambda: "key")
+        monkeypatch.setattr(quick.genai, "Client", self._fake_client_factory(closed))
+
+        async def get() -> object:
+            return quick.get_client()
+
+        assert asyncio.run(get()) is not asyncio.run(get())
+
+
 class TestSystemPrompt:
     """Test default system prompt generation."""
 
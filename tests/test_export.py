@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import time
+from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
@@ -205,6 +206,34 @@ class TestJsonExport:
         assert data["title"] is None
         assert data["summary"] is None
 
+    def test_json_stdlib_fallback(
+        self, sample_session: ResearchSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test JSON export without orjson uses the stdlib json module."""
+        monkeypatch.setattr("gemini_research_mcp.export._HAS_ORJSON", False)
+        exported_at = datetime(2026, 1, 1, tzinfo=UTC)
+
+        result = export_to_json(sample_session, exported_at=exported_at)
+
+        data = json.loads(result.content.decode("utf-8"))
+        assert data["interaction_id"] == sample_session.interaction_id
+        assert result.content.startswith(b'{\n  "')
+
+    def test_json_orjson_matches_stdlib(
+        self, sample_session: ResearchSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test orjson and stdlib json write byte-identical exports."""
+        pytest.importorskip("orjson")
+        monkeypatch.setattr("gemini_research_mcp.export._HAS_ORJSON", True)
+        exported_at = datetime(2026, 1, 1, tzinfo=UTC)
+        sample_session.summary = "Résumé — post-quantum 🔐"
+
+        fast = export_to_json(sample_session, exported_at=exported_at)
+        monkeypatch.setattr("gemini_research_mcp.export._HAS_ORJSON", False)
+        fallback = export_to_json(sample_session, exported_at=exported_at)
+
+        assert fast.content == fallback.content
+
 
 # =============================================================================
 # DOCX Export Tests
@@ -554,6 +583,16 @@ class TestExportSession:
         assert output_path.exists()
         assert output_path.read_bytes() == result.content
 
+    def test_export_session_shared_timestamp(self, sample_session: ResearchSession) -> None:
+        """A caller-supplied timestamp should be embedded in every format."""
+        stamp = datetime(2026, 3, 4, 5, 6, 7, tzinfo=UTC)
+
+        md = export_session(sample_session, "markdown", exported_at=stamp)
+        data = json.loads(export_session(sample_session, "json", exported_at=stamp).content)
+
+        assert b"2026-03-04 05:06:07 UTC" in md.content
+        assert data["export_timestamp"] == "2026-03-04T05:06:07+00:00"
+
 
 # =============================================================================
 # Filename Generation Tests
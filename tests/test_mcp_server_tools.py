@@ -1,3 +1,4 @@
+import asyncio
 from types import SimpleNamespace
 from typing import Any
 
@@ -5,10 +6,12 @@ import pytest
 
 from gemini_research_mcp import deep
 from gemini_research_mcp.deep import (
+    _coalesce_text_events,
     analyze_mcp_tool_for_gemini,
     build_interactions_tools,
     deep_research_stream,
 )
+from gemini_research_mcp.types import DeepResearchProgress
 
 
 def test_build_interactions_tools_combines_file_search_and_mcp() -> None:
@@ -189,3 +192,86 @@ async def test_deep_research_stream_passes_mcp_servers_to_interactions(
             "allowed_tools": [{"tools": ["get_fixture"]}],
         }
     ]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_text_events_merges_deltas_in_order() -> None:
+    async def source() -> Any:
+        yield DeepResearchProgress(event_type="start", interaction_id="i-1")
+        for n in range(3):
+            yield DeepResearchProgress(
+                event_type="text", content=f"part{n} ", interaction_id="i-1", event_id=f"e{n}"
+            )
+        yield DeepResearchProgress(event_type="complete", interaction_id="i-1")
+
+    events = [event async for event in _coalesce_text_events(source())]
+
+    assert [event.event_type for event in events] == ["start", "text", "complete"]
+    assert events[1].content == "part0 part1 part2 "
+    assert events[1].event_id == "e2"
+
+
+@pytest.mark.asyncio
+async def test_coalesce_text_events_cancelled_mid_pause() -> None:
+    paused = asyncio.Event()
+    closed = asyncio.Event()
+
+    async def source() -> Any:
+        try:
+            yield DeepResearchProgress(event_type="text", content="early ", event_id="e0")
+            paused.set()
+            await asyncio.Event().wait()  # generation never resumes
+            yield DeepResearchProgress(event_type="text", content="late", event_id="e1")
+        finally:
+            closed.set()
+
+    events: list[DeepResearchProgress] = []
+
+    async def consume() -> None:
+        async for event in _coalesce_text_events(source()):
+            events.append(event)
+
+    tasks_before = asyncio.all_tasks()
+    consumer = asyncio.create_task(consume())
+    await asyncio.wait_for(paused.wait(), timeout=5)
+    consumer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await consumer
+
+    # Cancellation reaches the stream itself and leaves no helper tasks behind
+    assert closed.is_set()
+    assert asyncio.all_tasks() == tasks_before
+    assert events == []
+
+
+@pytest.mark.asyncio
+async def test_deep_research_polls_with_status_callbacks(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_stream(query: str, **kwargs: Any) -> Any:
+        yield DeepResearchProgress(event_type="start", interaction_id="i-1")
+
+    statuses = iter(["in_progress", "in_progress", "completed"])
+
+    class FakeInteractions:
+        async def get(self, **kwargs: Any) -> Any:
+            return SimpleNamespace(
+                status=next(statuses), outputs=[SimpleNamespace(text="polled report")]
+            )
+
+    fake_client = SimpleNamespace(aio=SimpleNamespace(interactions=FakeInteractions()))
+    monkeypatch.delenv("GEMINI_RESEARCH_CACHE_TTL_SECONDS", raising=False)
+    monkeypatch.setattr(deep, "deep_research_stream", fake_stream)
+    monkeypatch.setattr(deep, "_get_healthy_client", lambda: fake_client)
+    monkeypatch.setattr(deep, "_jittered", lambda delay, jitter: 0.0)
+
+    seen: list[str | None] = []
+
+    async def on_progress(progress: DeepResearchProgress) -> None:
+        if progress.event_type == "status":
+            seen.append(progress.content)
+
+    result = await deep.deep_research("q", resolve_citations=False, on_progress=on_progress)
+
+    assert result.text == "polled report"
+    assert len(seen) == 3
+    assert seen[0] is not None and seen[0].startswith("Waiting... (in_progress")
+    assert seen[2] is not None and seen[2].startswith("Waiting... (completed")
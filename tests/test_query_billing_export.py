@@ -0,0 +1,51 @@
+"""Unit tests for the billing export query script.
+
+Checks the generated BigQuery SQL without running it.
+Run with: uv run pytest tests/test_query_billing_export.py -v
+"""
+
+import importlib.util
+import re
+from pathlib import Path
+
+_SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "query_billing_export.py"
+
+
+def _load_script():
+    spec = importlib.util.spec_from_file_location("query_billing_export", _SCRIPT)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestBuildCostQuery:
+    """Test the per-SKU cost query text."""
+
+    def test_aliases_do_not_shadow_export_columns(self):
+        """SELECT aliases must not reuse the sku/cost column names."""
+        query = _load_script()._build_cost_query(30)
+        aliases = set(re.findall(r"\bas (\w+)", query, flags=re.IGNORECASE))
+        assert aliases.isdisjoint({"sku", "cost", "usage", "service"})
+        assert "sku_description" in aliases
+        assert "total_cost" in aliases
+
+    def test_group_and_order_use_unambiguous_names(self):
+        """GROUP BY / ORDER BY reference the aliases, not the columns."""
+        query = _load_script()._build_cost_query(30)
+        assert "GROUP BY sku_description, category" in query
+        assert "ORDER BY total_cost DESC" in query
+
+    def test_wildcard_table_and_interval(self):
+        """Query reads the wildcard export table over the requested window."""
+        module = _load_script()
+        query = module._build_cost_query(7)
+        assert f"FROM `{module.TABLE_PATTERN}`" in query
+        assert "INTERVAL 7 DAY" in query
+
+    def test_date_filter_applies_to_every_service_match(self):
+        """The service ORs are grouped so the date filter bounds all of them."""
+        query = _load_script()._build_cost_query(30)
+        where = query[query.index("WHERE"):query.index("GROUP BY")]
+        assert where.split()[1] == "("
+        assert ")\n    AND DATE(usage_start_time)" in where
@@ -0,0 +1,110 @@
+"""Unit tests for the deep_research response cache."""
+
+from typing import Any
+
+import pytest
+
+from gemini_research_mcp import deep
+from gemini_research_mcp.types import (
+    DeepResearchProgress,
+    DeepResearchResult,
+    DeepResearchUsage,
+    Source,
+)
+
+
+def test_response_cache_expires_and_evicts_oldest(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [100.0]
+    monkeypatch.setattr(deep.time, "monotonic", lambda: clock[0])
+    cache = deep.ResponseCache(ttl_seconds=10, max_entries=2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    clock[0] += 10
+    assert cache.get("c") is None
+
+
+@pytest.mark.asyncio
+async def test_deep_research_serves_repeat_query_from_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = 0
+
+    async def fake_stream(query: str, **kwargs: Any) -> Any:
+        nonlocal calls
+        calls += 1
+        yield DeepResearchProgress(event_type="start", interaction_id="i-1")
+        yield DeepResearchProgress(event_type="text", content="report", interaction_id="i-1")
+        yield DeepResearchProgress(event_type="complete", interaction_id="i-1")
+
+    monkeypatch.setenv("GEMINI_RESEARCH_CACHE_TTL_SECONDS", "60")
+    monkeypatch.setattr(deep, "_response_cache", None)
+    monkeypatch.setattr(deep, "deep_research_stream", fake_stream)
+
+    events: list[str] = []
+    first = await deep.deep_research("q", resolve_citations=False)
+    second = await deep.deep_research(
+        "q", resolve_citations=False, on_progress=lambda p: events.append(p.event_type)
+    )
+    other = await deep.deep_research("other", resolve_citations=False)
+
+    assert calls == 2
+    assert second.text == first.text == "report"
+    assert second is not first
+    assert events == ["complete"]
+    assert other.interaction_id == "i-1"
+
+    # Mutating a returned result must not leak into later cache hits
+    second.thinking_summaries.append("mutated")
+    second.citations.append(Source(uri="https://example.com", title="Example"))
+    third = await deep.deep_research("q", resolve_citations=False)
+    assert third.thinking_summaries == []
+    assert third.citations == []
+
+
+@pytest.mark.asyncio
+async def test_deep_research_cache_disabled_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = 0
+
+    async def fake_stream(query: str, **kwargs: Any) -> Any:
+        nonlocal calls
+        calls += 1
+        yield DeepResearchProgress(event_type="text", content="report")
+
+    monkeypatch.delenv("GEMINI_RESEARCH_CACHE_TTL_SECONDS", raising=False)
+    monkeypatch.setattr(deep, "deep_research_stream", fake_stream)
+
+    await deep.deep_research("q", resolve_citations=False)
+    await deep.deep_research("q", resolve_citations=False)
+
+    assert calls == 2
+
+
+def test_copy_result_drops_raw_interaction() -> None:
+    class LiveInteraction:
+        """Stands in for an SDK object that cannot be copied."""
+
+        def __deepcopy__(self, memo: dict[int, Any]) -> Any:
+            raise TypeError("cannot copy a live interaction")
+
+    usage = DeepResearchUsage(total_tokens=10, raw_usage={"total_tokens": 10})
+    result = DeepResearchResult(
+        text="report",
+        thinking_summaries=["thought"],
+        usage=usage,
+        raw_interaction=LiveInteraction(),
+    )
+
+    copied = deep._copy_result(result)
+
+    assert copied.raw_interaction is None
+    assert copied.text == "report"
+    assert copied.thinking_summaries == ["thought"]
+    assert copied.thinking_summaries is not result.thinking_summaries
+    assert copied.usage is not None and copied.usage is not usage
+    assert copied.usage.raw_usage == {"total_tokens": 10}
+    assert copied.usage.raw_usage is not usage.raw_usage
@@ -219,6 +219,11 @@ class TestDeepResearchProgress:
         assert progress.interaction_id == "int_123"
         assert progress.event_id == "evt_456"
 
+    def test_slots(self):
+        """One progress event is built per streamed chunk, so no per-instance dict."""
+        progress = DeepResearchProgress(event_type="text", content="chunk")
+        assert not hasattr(progress, "__dict__")
+
     def test_event_types(self):
         """Should support all expected event types."""
         for event_type in ["start", "thought", "text", "complete", "error", "status"]: